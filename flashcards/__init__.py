@@ -1,21 +1,43 @@
 """Flash Card Game for Medical Terminology."""
 
-from .app import (
-    App,
-    FlashCardApp,
-    QuizCardApp,
-    MainMenu,
-    fix_rtl,
-    parse_markdown_tables,
-    main,
-)
+import importlib
+
+from .main import main
+
+# Remaining public names and the submodule defining each. They are imported on
+# first access, so using the parser alone does not load tkinter and the screens.
+_LAZY_ATTRS = {
+    "App": "controller",
+    "Card": "models",
+    "FlashCardApp": "screens",
+    "QuizCardApp": "screens",
+    "MainMenu": "screens",
+    "fix_rtl": "utils",
+    "parse_markdown_tables": "utils",
+    "parse_markdown_text": "utils",
+}
 
 __all__ = [
     "App",
+    "Card",
     "FlashCardApp",
     "QuizCardApp",
     "MainMenu",
     "fix_rtl",
     "parse_markdown_tables",
+    "parse_markdown_text",
     "main",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,15 +4,18 @@ This module serves as a facade for backward compatibility.
 All public symbols are re-exported from their respective modules.
 """
 
-from .utils import fix_rtl, parse_markdown_tables
+from .models import Card
+from .utils import fix_rtl, parse_markdown_tables, parse_markdown_text
 from .screens import MainMenu, FlashCardApp, QuizCardApp, QuizResultsScreen, ScoreboardScreen
 from .controller import App
 from .main import main
-from .history import get_history_path, save_quiz_result, load_quiz_history
+from .history import get_history_path, save_quiz_result, load_quiz_history, iter_quiz_history
 
 __all__ = [
+    "Card",
     "fix_rtl",
     "parse_markdown_tables",
+    "parse_markdown_text",
     "MainMenu",
     "FlashCardApp",
     "QuizCardApp",
@@ -23,4 +26,5 @@ __all__ = [
     "get_history_path",
     "save_quiz_result",
     "load_quiz_history",
+    "iter_quiz_history",
 ]
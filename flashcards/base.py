@@ -3,11 +3,13 @@
 import tkinter as tk
 from abc import ABC, abstractmethod
 
+from .models import Card
+
 
 class BaseCardApp(ABC):
     """Abstract base class for card-based screens (FlashCard and Quiz modes)."""
 
-    def __init__(self, root: tk.Tk, cards: list[dict], on_back_to_menu: callable = None):
+    def __init__(self, root: tk.Tk, cards: list[Card], on_back_to_menu: callable = None):
         self.root = root
         self.frame = tk.Frame(root, bg="#2c3e50")
         self.cards = cards
@@ -73,7 +75,7 @@ class BaseCardApp(ABC):
 
     def _next_card(self):
         """Go to the next card."""
-        if self.cards and self.current_index < len(self.cards) - 1:
+        if self.current_index < len(self.cards) - 1:
             self.current_index += 1
             self._on_card_changed()
 
@@ -95,15 +97,19 @@ class BaseCardApp(ABC):
         """Hide the screen."""
         self.frame.pack_forget()
 
-    def _apply_dynamic_text_size(self, label: tk.Label, text: str, is_rtl: bool = True):
-        """Apply dynamic font size and wrapping to a label."""
+    def _render_text(self, text: str, is_rtl: bool = True) -> dict:
+        """Return label options (text, font, wraplength) sized for the text."""
         from .utils import calculate_font_size, fix_rtl
 
         sizing = calculate_font_size(text)
         display_text = fix_rtl(text, sizing['wrap_chars']) if is_rtl else text
 
-        label.config(
-            text=display_text,
-            font=("Helvetica", sizing['font_size'], "bold"),
-            wraplength=sizing['wraplength']
-        )
+        return {
+            "text": display_text,
+            "font": ("Helvetica", sizing['font_size'], "bold"),
+            "wraplength": sizing['wraplength'],
+        }
+
+    def _apply_dynamic_text_size(self, label: tk.Label, text: str, is_rtl: bool = True):
+        """Apply dynamic font size and wrapping to a label."""
+        label.config(**self._render_text(text, is_rtl))
@@ -1,67 +1,131 @@
 """Main application controller managing screens."""
 
 import tkinter as tk
+from itertools import chain
+from typing import TYPE_CHECKING
 
-from .screens import MainMenu, FlashCardApp, QuizCardApp, QuizResultsScreen, ScoreboardScreen
+# Only the main menu is needed at startup; the other screens are imported
+# when first opened so the menu can paint sooner.
+from .screens.main_menu import MainMenu
 from .history import save_quiz_result
+from .models import Card
 from .utils import spread_shuffle_with_replacement
 
+if TYPE_CHECKING:
+    from .screens.flashcard import FlashCardApp
+
 
 class App:
     """Main application managing screens."""
 
-    def __init__(self, root: tk.Tk, cards: list[dict], sections: list[str] = None):
+    def __init__(self, root: tk.Tk, cards: list[Card], sections: list[str] = None, loading: bool = False):
         self.root = root
-        self.cards = cards
-        self.sections = sections or []
 
         self.root.title("Flash Card Game - Medical Terminology")
         self.root.geometry("600x400")
         self.root.configure(bg="#2c3e50")
 
-        # Calculate section counts (filter out empty sections)
-        section_counts = {}
-        for card in self.cards:
-            section = card.get("section")
-            if section:
-                section_counts[section] = section_counts.get(section, 0) + 1
-
         # Create screens
-        self.main_menu = MainMenu(self.root, self._start_simple_mode, self._start_inverted_mode, self._start_quiz_mode, self._start_scoreboard_mode, section_counts)
+        self.main_menu = None
         self.flashcard_app = None
+        # Flashcard screens by mode, kept across visits so their widgets are built once
+        self._flashcard_screens: dict[str, "FlashCardApp"] = {}
         self.results_screen = None
         self.scoreboard_screen = None
+        self.set_cards(cards, sections, loading=loading)
 
-        # Show main menu
-        self.main_menu.show()
+        # Keyboard shortcuts are bound once and forwarded to the active screen
+        self.root.bind("<Left>", lambda e: self._on_flashcard_key("_prev_card"))
+        self.root.bind("<Right>", lambda e: self._on_flashcard_key("_next_card"))
+        self.root.bind("<space>", lambda e: self._on_flashcard_key("_flip_card"))
+        self.root.bind("<Return>", lambda e: self._on_return())
+
+    def set_cards(self, cards: list[Card], sections: list[str] = None, loading: bool = False):
+        """Load a deck, rebuilding the section index and the main menu.
+
+        Called with the initial deck, and by main() again once the deck has
+        finished loading in the background. While loading is set, the menu
+        shows a placeholder and keeps the card modes disabled.
+        """
+        self.cards = cards
+        self.sections = sections or []
+        # Cards grouped by section, in deck order, so filtering only touches selected sections
+        self._by_section: dict[str, list[Card]] = {}
+        for card in cards:
+            self._by_section.setdefault(card.section, []).append(card)
+        # Filtered decks by selected sections, valid until the deck is replaced
+        self._filtered_cards: dict[frozenset[str], list[Card]] = {}
+
+        # Calculate section counts (filter out empty sections)
+        section_counts = {section: len(group) for section, group in self._by_section.items() if section}
+
+        if self.main_menu is not None:
+            self.main_menu.hide()
+            self.main_menu.frame.destroy()
+        self.main_menu = MainMenu(self.root, self._start_simple_mode, self._start_inverted_mode, self._start_quiz_mode, self._start_scoreboard_mode, section_counts, loading=loading, has_cards=bool(cards))
+
+        # Show main menu, unless another screen was opened in the meantime
+        if self.flashcard_app is None and self.results_screen is None and self.scoreboard_screen is None:
+            self.main_menu.show()
 
-    def _prepare_mode_cards(self) -> list[dict]:
+    def _on_flashcard_key(self, action: str):
+        """Run a navigation action on the flashcard screen, if one is shown."""
+        if self.flashcard_app in self._flashcard_screens.values():
+            getattr(self.flashcard_app, action)()
+
+    def _on_return(self):
+        """Forward the Return key to the shown card or results screen, if any."""
+        screen = self.results_screen or self.flashcard_app
+        if screen is not None:
+            screen._handle_return()
+
+    def _prepare_mode_cards(self) -> list[Card]:
         """Prepare a shuffled deck of cards for a mode."""
-        selected = self.main_menu.get_selected_sections()
-        filtered = [c for c in self.cards if c.get("section") in selected]
-        if not filtered:
-            filtered = self.cards  # fallback if none selected
+        selected = frozenset(self.main_menu.get_selected_sections())
+        filtered = self._filtered_cards.get(selected)
+        if filtered is None:
+            filtered = self._filtered_cards[selected] = self._filter_cards(selected)
         card_count = self.main_menu.get_card_count()
         return spread_shuffle_with_replacement(filtered, card_count)
 
-    def _start_simple_mode(self):
-        """Switch to simple mode (flashcard game)."""
+    def _filter_cards(self, selected: frozenset[str]) -> list[Card]:
+        """Return the cards in the selected sections."""
+        if selected.issuperset(self._by_section):
+            return self.cards  # every section selected, no need to copy
+        filtered = list(chain.from_iterable(
+            group for section, group in self._by_section.items() if section in selected
+        ))
+        return filtered or self.cards  # fallback if none selected
+
+    def _start_flashcard_mode(self, mode: str):
+        """Switch to a flashcard mode, reusing the screen built on an earlier visit."""
         self.main_menu.hide()
         mode_cards = self._prepare_mode_cards()
-        self.flashcard_app = FlashCardApp(self.root, mode_cards, self._back_to_menu, mode="simple")
+        screen = self._flashcard_screens.get(mode)
+        if screen is None:
+            from .screens.flashcard import FlashCardApp
+
+            screen = FlashCardApp(self.root, mode_cards, self._back_to_menu, mode=mode)
+            self._flashcard_screens[mode] = screen
+        else:
+            screen.reset(mode_cards)
+        self.flashcard_app = screen
         self.flashcard_app.show()
 
+    def _start_simple_mode(self):
+        """Switch to simple mode (flashcard game)."""
+        self._start_flashcard_mode("simple")
+
     def _start_inverted_mode(self):
         """Switch to inverted mode (flashcard game with swapped front/back)."""
-        self.main_menu.hide()
-        mode_cards = self._prepare_mode_cards()
-        self.flashcard_app = FlashCardApp(self.root, mode_cards, self._back_to_menu, mode="inverted")
-        self.flashcard_app.show()
+        self._start_flashcard_mode("inverted")
 
     def _start_quiz_mode(self):
         """Switch to quiz mode (type the term for the interpretation)."""
         self.main_menu.hide()
         mode_cards = self._prepare_mode_cards()
+        from .screens.quiz import QuizCardApp
+
         self.flashcard_app = QuizCardApp(
             self.root, mode_cards, self._back_to_menu, self._on_quiz_complete
         )
@@ -70,6 +134,8 @@ class App:
     def _start_scoreboard_mode(self):
         """Switch to scoreboard screen."""
         self.main_menu.hide()
+        from .screens.scoreboard import ScoreboardScreen
+
         self.scoreboard_screen = ScoreboardScreen(self.root, self._back_to_menu_from_scoreboard)
         self.scoreboard_screen.show()
 
@@ -86,6 +152,8 @@ class App:
         if self.flashcard_app:
             self.flashcard_app.hide()
             self.flashcard_app = None
+        from .screens.quiz_results import QuizResultsScreen
+
         self.results_screen = QuizResultsScreen(
             self.root, correct, total, self._back_to_menu_from_results
         )
@@ -1,9 +1,15 @@
 """Quiz history persistence module."""
 
 import csv
+import functools
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
 
+# Rows are written by hand: the fields never need quoting, and the line
+# ending matches what csv.writer produced for existing history files.
+_HEADER_LINE = "time,number_of_questions,number_of_correct_answers\r\n"
+
 
 def get_history_path() -> Path:
     """Return the path to the history CSV file."""
@@ -20,35 +26,68 @@ def save_quiz_result(total: int, correct: int) -> None:
         correct: Number of correct answers.
     """
     history_path = get_history_path()
-    history_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        f = open(history_path, "a", newline="")
+    except FileNotFoundError:
+        # Only the first save ever needs to create the directory
+        history_path.parent.mkdir(parents=True, exist_ok=True)
+        f = open(history_path, "a", newline="")
+
+    with f:
+        # Append mode starts at the end of the file, so 0 means it is new or empty
+        header = _HEADER_LINE if f.tell() == 0 else ""
+        f.write(f"{header}{datetime.now().isoformat()},{total},{correct}\r\n")
+
 
-    file_exists = history_path.exists()
+def iter_quiz_history() -> Iterator[tuple[str, int, int]]:
+    """Iterate over quiz history from the CSV file, oldest first.
+
+    Yields:
+        Tuples of (time, total, correct).
+        Yields nothing if the file doesn't exist.
+    """
+    try:
+        f = open(get_history_path(), newline="")
+    except FileNotFoundError:
+        return
 
-    with open(history_path, "a", newline="") as f:
-        writer = csv.writer(f)
-        if not file_exists:
-            writer.writerow(["time", "number_of_questions", "number_of_correct_answers"])
-        writer.writerow([datetime.now().isoformat(), total, correct])
+    with f:
+        yield from _read_rows(f)
+
+
+def _read_rows(f: Iterable[str]) -> Iterator[tuple[str, int, int]]:
+    """Yield (time, total, correct) for each row of an open history file."""
+    reader = csv.reader(f)
+    next(reader, None)  # header
+    for row in reader:
+        if row:
+            yield row[0], int(row[1]), int(row[2])
 
 
 def load_quiz_history() -> list[dict]:
     """Load quiz history from the CSV file.
 
+    The parsed rows are memoized by the file's modification time and size,
+    so reopening the scoreboard doesn't re-read an unchanged file.
+
     Returns:
         List of dictionaries with keys: time, total, correct.
         Returns empty list if file doesn't exist.
     """
     history_path = get_history_path()
-    if not history_path.exists():
+    try:
+        stat = history_path.stat()
+        rows = _load_history(history_path, stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
         return []
+    return [
+        {"time": time, "total": total, "correct": correct}
+        for time, total, correct in rows
+    ]
+
 
-    results = []
+@functools.lru_cache(maxsize=4)
+def _load_history(history_path: Path, mtime_ns: int, size: int) -> tuple[tuple[str, int, int], ...]:
+    """Parse a history file; the modification time and size only key the cache."""
     with open(history_path, newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            results.append({
-                "time": row["time"],
-                "total": int(row["number_of_questions"]),
-                "correct": int(row["number_of_correct_answers"]),
-            })
-    return results
+        return tuple(_read_rows(f))
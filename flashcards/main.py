@@ -1,14 +1,17 @@
 """Main entry point for the flash card application."""
 
-import tkinter as tk
 from pathlib import Path
 
-from .utils import parse_markdown_tables
-from .controller import App
+from .utils import parse_markdown_tables, run_in_background, start_in_background, warm_rtl_cache
 
 
 def main():
     """Main entry point."""
+    # Deferred so that importing the package does not load tkinter
+    import tkinter as tk
+
+    from .controller import App
+
     # Find the markdown file relative to this script
     script_dir = Path(__file__).parent
     md_file = script_dir / "medical-terms.md"
@@ -17,10 +20,26 @@ def main():
         print(f"Error: {md_file} not found")
         return
 
-    # Parse cards
-    cards, sections = parse_markdown_tables(str(md_file))
-
-    # Create and run the app
+    # Create the app with an empty deck so the window paints right away
     root = tk.Tk()
-    app = App(root, cards, sections)
+    app = App(root, [], loading=True)
+    _load_deck(root, app, md_file)
     root.mainloop()
+
+
+def _load_deck(root, app, md_file: Path):
+    """Parse the deck on a worker thread and hand it to the app when ready."""
+    from tkinter import messagebox
+
+    def on_parsed(result):
+        cards, sections = result
+        app.set_cards(cards, sections)
+        # Render the Hebrew card faces in the background while the menu is shown
+        start_in_background(warm_rtl_cache, cards)
+
+    def on_failed(error):
+        # Without a deck there is nothing to study, so report the error and quit
+        messagebox.showerror("Flash Card Game", f"Could not load {md_file.name}:\n{error}")
+        root.destroy()
+
+    run_in_background(root, parse_markdown_tables, on_parsed, on_failed, str(md_file))
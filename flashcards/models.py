@@ -0,0 +1,20 @@
+"""Data model for the flash card application."""
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class Card:
+    """A single flash card parsed from the markdown tables."""
+
+    term: str
+    interpretation: str
+    extra: str = ""
+    section: str = ""
+
+    @property
+    def full_interpretation(self) -> str:
+        """The interpretation, followed by the extra note in parentheses if present."""
+        if self.extra:
+            return f"{self.interpretation}\n\n({self.extra})"
+        return self.interpretation
@@ -1,9 +1,28 @@
 """Screen classes for the flash card application."""
 
-from .main_menu import MainMenu
-from .flashcard import FlashCardApp
-from .quiz import QuizCardApp
-from .quiz_results import QuizResultsScreen
-from .scoreboard import ScoreboardScreen
+import importlib
+
+# Each screen is imported from its module on first access, so importing one
+# screen module does not load all of them.
+_SCREEN_MODULES = {
+    "MainMenu": "main_menu",
+    "FlashCardApp": "flashcard",
+    "QuizCardApp": "quiz",
+    "QuizResultsScreen": "quiz_results",
+    "ScoreboardScreen": "scoreboard",
+}
 
 __all__ = ["MainMenu", "FlashCardApp", "QuizCardApp", "QuizResultsScreen", "ScoreboardScreen"]
+
+
+def __getattr__(name: str):
+    if name in _SCREEN_MODULES:
+        module = importlib.import_module(f".{_SCREEN_MODULES[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
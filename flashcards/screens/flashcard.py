@@ -3,20 +3,31 @@
 import tkinter as tk
 
 from ..base import BaseCardApp
+from ..models import Card
 from ..utils import spread_shuffle
 
+# Navigation redraws are throttled to one per this many milliseconds
+_NAV_REDRAW_DELAY_MS = 20
+
 
 class FlashCardApp(BaseCardApp):
     """Tkinter-based flash card application."""
 
-    def __init__(self, root: tk.Tk, cards: list[dict], on_back_to_menu: callable = None, mode: str = "simple"):
+    def __init__(self, root: tk.Tk, cards: list[Card], on_back_to_menu: callable = None, mode: str = "simple"):
         super().__init__(root, cards, on_back_to_menu)
-        self.original_order = cards.copy()
         self.is_flipped = False
         self.mode = mode
+        self._pending_show = None
+        # Rendered (front, back) label options, computed once per distinct card
+        self._faces = {}
+        self._cache_faces(cards)
+        back_hint = "(click to see term)" if mode == "simple" else "(click to see interpretation)"
+        self._hints = (
+            {"text": "(click to flip)", "bg": "#ecf0f1"},
+            {"text": back_hint, "bg": "#d5f5e3"},
+        )
 
         self._setup_ui()
-        self._bind_keys()
         self._show_card()
 
     def _setup_ui(self):
@@ -96,13 +107,6 @@ class FlashCardApp(BaseCardApp):
         self.hint_label.pack(pady=(0, 15))
         self.hint_label.bind("<Button-1>", lambda e: self._flip_card())
 
-    def _bind_keys(self):
-        """Bind keyboard shortcuts."""
-        self.root.bind("<Left>", lambda e: self._prev_card())
-        self.root.bind("<Right>", lambda e: self._next_card())
-        self.root.bind("<space>", lambda e: self._flip_card())
-        self.root.bind("<Return>", lambda e: self._flip_card())
-
     def _show_card(self):
         """Display the current card."""
         if not self.cards:
@@ -110,45 +114,55 @@ class FlashCardApp(BaseCardApp):
             self.counter_label.config(text="0 / 0")
             return
 
-        card = self.cards[self.current_index]
+        # Both sequences are indexed by the flip state: 0 = front, 1 = back
+        face = self._faces[self.cards[self.current_index]][self.is_flipped]
+        hint = self._hints[self.is_flipped]
 
-        if self.mode == "simple":
-            front_text = card["term"]
-            back_text = card["interpretation"]
-            if card["extra"]:
-                back_text += f"\n\n({card['extra']})"
-            front_hint = "(click to flip)"
-            back_hint = "(click to see term)"
-            front_is_rtl = False
-            back_is_rtl = True
-        else:  # inverted mode
-            front_text = card["interpretation"]
-            back_text = card["term"]
-            front_hint = "(click to flip)"
-            back_hint = "(click to see interpretation)"
-            front_is_rtl = True
-            back_is_rtl = False
-
-        if self.is_flipped:
-            self._apply_dynamic_text_size(self.term_label, back_text, is_rtl=back_is_rtl)
-            self.term_label.config(fg="#27ae60")
-            self.hint_label.config(text=back_hint)
-            self.card_frame.config(bg="#d5f5e3")
-            self.term_label.config(bg="#d5f5e3")
-            self.hint_label.config(bg="#d5f5e3")
-        else:
-            self._apply_dynamic_text_size(self.term_label, front_text, is_rtl=front_is_rtl)
-            self.term_label.config(fg="#2c3e50")
-            self.hint_label.config(text=front_hint)
-            self.card_frame.config(bg="#ecf0f1")
-            self.term_label.config(bg="#ecf0f1")
-            self.hint_label.config(bg="#ecf0f1")
+        # One configure per widget; the face carries its own text, font and colours
+        self.term_label.config(**face)
+        self.hint_label.config(**hint)
+        self.card_frame.config(bg=hint["bg"])
 
         self._update_counter()
 
+    def reset(self, cards: list[Card]):
+        """Load a new deck into the screen, reusing its widgets."""
+        self.cards = cards
+        self._cache_faces(cards)
+        self.current_index = 0
+        self.is_flipped = False
+        self._show_card()
+
+    def _cache_faces(self, cards: list[Card]):
+        """Render the faces of any cards not seen by this screen before."""
+        for card in cards:
+            if card not in self._faces:
+                self._faces[card] = self._card_faces(card)
+
+    def _card_faces(self, card: Card) -> tuple[dict, dict]:
+        """Return the rendered (front, back) term label options for a card."""
+        if self.mode == "simple":
+            front, back = self._render_text(card.term, is_rtl=False), self._render_text(card.full_interpretation)
+        else:  # inverted mode
+            front, back = self._render_text(card.interpretation), self._render_text(card.term, is_rtl=False)
+        front.update(fg="#2c3e50", bg="#ecf0f1")
+        back.update(fg="#27ae60", bg="#d5f5e3")
+        return front, back
+
     def _on_card_changed(self):
-        """Called when the current card changes."""
+        """Called when the current card changes.
+
+        The redraw is deferred briefly and shared by any further navigation
+        in that window, so a held arrow key redraws once per interval rather
+        than once per key repeat.
+        """
         self.is_flipped = False
+        if self._pending_show is None:
+            self._pending_show = self.root.after(_NAV_REDRAW_DELAY_MS, self._show_pending_card)
+
+    def _show_pending_card(self):
+        """Run the deferred redraw for the current card."""
+        self._pending_show = None
         self._show_card()
 
     def _flip_card(self):
@@ -156,15 +170,13 @@ class FlashCardApp(BaseCardApp):
         self.is_flipped = not self.is_flipped
         self._show_card()
 
-    def _next_card(self):
-        """Go to the next card."""
-        if self.cards and self.current_index < len(self.cards) - 1:
-            self.current_index += 1
-            self._on_card_changed()
+    def _handle_return(self):
+        """Handle Return key - flip the current card."""
+        self._flip_card()
 
     def _prev_card(self):
         """Go to the previous card."""
-        if self.cards and self.current_index > 0:
+        if self.current_index > 0:
             self.current_index -= 1
             self._on_card_changed()
 
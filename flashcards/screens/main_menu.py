@@ -8,14 +8,19 @@ from ..utils import fix_rtl
 class MainMenu:
     """Main menu screen."""
 
-    def __init__(self, parent: tk.Frame, start_simple_mode: callable, start_inverted_mode: callable, start_quiz_mode: callable, start_scoreboard_mode: callable, section_counts: dict[str, int] = None):
+    def __init__(self, parent: tk.Frame, start_simple_mode: callable, start_inverted_mode: callable, start_quiz_mode: callable, start_scoreboard_mode: callable, section_counts: dict[str, int] = None, loading: bool = False, has_cards: bool = True):
         self.frame = tk.Frame(parent, bg="#2c3e50")
         self.start_simple_mode = start_simple_mode
         self.start_inverted_mode = start_inverted_mode
         self.start_quiz_mode = start_quiz_mode
         self.start_scoreboard_mode = start_scoreboard_mode
         self.section_counts = section_counts or {}
+        # Whether the deck is still being loaded, and whether the loaded deck has any cards
+        self.loading = loading
+        self.has_cards = has_cards
         self.section_vars: dict[str, tk.BooleanVar] = {}
+        # Kept in step with the checkboxes, so reading the selection doesn't query every variable
+        self._selected: set[str] = set()
         self._setup_ui()
 
     def _setup_ui(self):
@@ -140,10 +145,12 @@ class MainMenu:
             for section, count in self.section_counts.items():
                 var = tk.BooleanVar(value=True)
                 self.section_vars[section] = var
+                self._selected.add(section)
                 cb = tk.Checkbutton(
                     scrollable_frame,
                     text=fix_rtl(f"{section} - {count} terms", wrap_width=None),
                     variable=var,
+                    command=lambda s=section: self._on_section_toggled(s),
                     font=("Helvetica", 10),
                     fg="white",
                     bg="#2c3e50",
@@ -156,10 +163,22 @@ class MainMenu:
                 cb.bind("<Button-4>", self._on_mousewheel)
                 cb.bind("<Button-5>", self._on_mousewheel)
                 cb.bind("<MouseWheel>", self._on_mousewheel)
+        elif self.loading or not self.has_cards:
+            # Stands in for the sections list; while loading, App.set_cards()
+            # replaces this menu once the deck has been parsed
+            status_label = tk.Label(
+                self.frame,
+                text="Loading…" if self.loading else "No cards found",
+                font=("Helvetica", 12),
+                fg="#bdc3c7",
+                bg="#2c3e50",
+            )
+            status_label.pack(pady=(5, 2))
 
-        # Mode buttons in 2x2 grid
+        # Mode buttons in 2x2 grid; the card modes wait until a deck has loaded
         buttons_frame = tk.Frame(self.frame, bg="#2c3e50")
         buttons_frame.pack(pady=5)
+        mode_state = tk.DISABLED if self.loading else tk.NORMAL
 
         simple_mode_btn = tk.Button(
             buttons_frame,
@@ -167,6 +186,7 @@ class MainMenu:
             font=("Helvetica", 14),
             command=self.start_simple_mode,
             width=12,
+            state=mode_state,
         )
         simple_mode_btn.grid(row=0, column=0, padx=5, pady=3)
 
@@ -176,6 +196,7 @@ class MainMenu:
             font=("Helvetica", 14),
             command=self.start_inverted_mode,
             width=12,
+            state=mode_state,
         )
         inverted_mode_btn.grid(row=0, column=1, padx=5, pady=3)
 
@@ -185,6 +206,7 @@ class MainMenu:
             font=("Helvetica", 14),
             command=self.start_quiz_mode,
             width=12,
+            state=mode_state,
         )
         quiz_mode_btn.grid(row=1, column=0, padx=5, pady=3)
 
@@ -205,11 +227,20 @@ class MainMenu:
         """Set all section checkboxes to True."""
         for var in self.section_vars.values():
             var.set(True)
+        self._selected = set(self.section_vars)
 
     def _uncheck_all(self):
         """Set all section checkboxes to False."""
         for var in self.section_vars.values():
             var.set(False)
+        self._selected.clear()
+
+    def _on_section_toggled(self, section: str):
+        """Record a section checkbox being clicked on or off."""
+        if self.section_vars[section].get():
+            self._selected.add(section)
+        else:
+            self._selected.discard(section)
 
     def _scroll_down(self, event=None):
         """Scroll the sections list down."""
@@ -241,7 +272,7 @@ class MainMenu:
 
     def get_selected_sections(self) -> set[str]:
         """Return the set of selected section names."""
-        return {section for section, var in self.section_vars.items() if var.get()}
+        return set(self._selected)
 
     def show(self):
         """Show the main menu."""
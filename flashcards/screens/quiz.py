@@ -1,8 +1,30 @@
 """Quiz screen for the flash card application."""
 
+import functools
 import tkinter as tk
 
 from ..base import BaseCardApp
+from ..models import Card
+
+
+@functools.lru_cache(maxsize=4096)
+def _answer_terms(text: str) -> frozenset[str]:
+    """Split a comma-separated answer into its normalized terms (case and dashes ignored).
+
+    Memoized so a card's correct terms are normalized once per session, not
+    once per quiz.
+    """
+    terms = (t.strip().lower().replace("-", "") for t in text.split(","))
+    return frozenset(t for t in terms if t)
+
+
+def _grade_answer(user_terms: frozenset[str], correct_terms: frozenset[str]) -> str:
+    """Grade an answer as "correct", "partial" (some of the terms, none wrong) or "incorrect"."""
+    if user_terms == correct_terms:
+        return "correct"
+    if user_terms and user_terms <= correct_terms:
+        return "partial"
+    return "incorrect"
 
 
 class QuizCardApp(BaseCardApp):
@@ -11,7 +33,7 @@ class QuizCardApp(BaseCardApp):
     def __init__(
         self,
         root: tk.Tk,
-        cards: list[dict],
+        cards: list[Card],
         on_back_to_menu: callable = None,
         on_quiz_complete: callable = None,
     ):
@@ -19,9 +41,11 @@ class QuizCardApp(BaseCardApp):
         self.current_answered = False
         self.correct_count = 0
         self.on_quiz_complete = on_quiz_complete
+        self._feedback_shown = False
+        # Normalized correct terms per card, so a submit only normalizes the user's answer
+        self._correct_terms = {card: _answer_terms(card.term) for card in cards}
 
         self._setup_ui()
-        self._bind_keys()
         self._show_card()
 
     def _setup_ui(self):
@@ -40,7 +64,7 @@ class QuizCardApp(BaseCardApp):
         self.result_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=30, pady=5)
 
         # Inner result box (will be colored on answer)
-        self.result_box = tk.Frame(self.result_frame, padx=15, pady=8)
+        self.result_box = tk.Frame(self.result_frame, padx=15, pady=8, bg="#2c3e50")
         self.result_box.pack()
 
         # Message label (e.g., "Correct!" or "Incorrect. Answer:")
@@ -48,6 +72,8 @@ class QuizCardApp(BaseCardApp):
             self.result_box,
             text="",
             font=("Helvetica", 14),
+            fg="white",
+            bg="#2c3e50",
         )
         self.result_msg_label.pack(side=tk.LEFT)
 
@@ -56,6 +82,8 @@ class QuizCardApp(BaseCardApp):
             self.result_box,
             text="",
             font=("Helvetica", 14, "bold"),
+            fg="white",
+            bg="#2c3e50",
         )
         self.result_term_label.pack(side=tk.LEFT)
 
@@ -106,10 +134,6 @@ class QuizCardApp(BaseCardApp):
         )
         self.hint_label.pack(pady=(0, 15))
 
-    def _bind_keys(self):
-        """Bind keyboard shortcuts."""
-        self.root.bind("<Return>", lambda e: self._handle_return())
-
     def _show_card(self):
         """Display the current card."""
         if not self.cards:
@@ -118,7 +142,7 @@ class QuizCardApp(BaseCardApp):
             return
 
         card = self.cards[self.current_index]
-        self._apply_dynamic_text_size(self.interpretation_label, card["interpretation"], is_rtl=True)
+        self._apply_dynamic_text_size(self.interpretation_label, card.interpretation, is_rtl=True)
 
         # Clear input and result
         self.entry.delete(0, tk.END)
@@ -136,29 +160,22 @@ class QuizCardApp(BaseCardApp):
 
     def _submit_answer(self):
         """Check the user's answer."""
-        if self.current_answered:
+        if self.current_answered or not self.cards:
             return
 
-        user_answer = self.entry.get().strip().lower().replace("-", "")
-        correct_term = self.cards[self.current_index]["term"]
+        card = self.cards[self.current_index]
+        correct_term = card.term
 
         self.current_answered = True
 
-        # Normalize for comparison (ignore dashes)
-        def normalize(s):
-            return s.strip().lower().replace("-", "")
-
-        # Parse comma-separated terms into sets
-        user_terms = {normalize(t) for t in user_answer.split(",") if normalize(t)}
-        correct_terms = {normalize(t) for t in correct_term.split(",") if normalize(t)}
-
-        is_correct = user_terms == correct_terms or (user_terms and user_terms.issubset(correct_terms))
-        if is_correct:
+        # Compare comma-separated terms as sets
+        grade = _grade_answer(_answer_terms(self.entry.get()), self._correct_terms[card])
+        if grade != "incorrect":
             self.correct_count += 1
 
-        if user_terms == correct_terms:
+        if grade == "correct":
             self._show_feedback("Correct!", "", is_correct=True)
-        elif user_terms and user_terms.issubset(correct_terms):
+        elif grade == "partial":
             self._show_feedback("Correct! Full answer: ", correct_term, is_correct=True)
         else:
             self._show_feedback("Incorrect. Answer: ", correct_term, is_correct=False)
@@ -168,11 +185,16 @@ class QuizCardApp(BaseCardApp):
         bg_color = "#27ae60" if is_correct else "#e74c3c"  # green or red
 
         self.result_box.config(bg=bg_color)
-        self.result_msg_label.config(text=message, bg=bg_color, fg="white")
-        self.result_term_label.config(text=term, bg=bg_color, fg="white")
+        # The labels' white text is set once when they are created
+        self.result_msg_label.config(text=message, bg=bg_color)
+        self.result_term_label.config(text=term, bg=bg_color)
+        self._feedback_shown = True
 
     def _clear_feedback(self):
         """Clear the feedback display."""
+        if not self._feedback_shown:
+            return  # already clear
+        self._feedback_shown = False
         self.result_box.config(bg="#2c3e50")
         self.result_msg_label.config(text="", bg="#2c3e50")
         self.result_term_label.config(text="", bg="#2c3e50")
@@ -56,9 +56,6 @@ class QuizResultsScreen:
         )
         menu_btn.pack(pady=30)
 
-        # Bind Enter key to return to menu
-        self.root.bind("<Return>", lambda e: self._handle_return())
-
     def _handle_return(self):
         """Handle Return key - return to menu."""
         if self.on_back_to_menu:
@@ -1,10 +1,61 @@
 """Scoreboard screen displaying quiz history."""
 
 import tkinter as tk
+from itertools import islice
 from tkinter import ttk
 from datetime import datetime
 
 from ..history import load_quiz_history
+from ..utils import run_in_background
+
+# Rows are inserted into the table this many at a time, as it is scrolled
+_ROW_BATCH = 100
+# Fraction of the table scrolled past at which the next batch is inserted
+_LOAD_MORE_AT = 0.9
+
+
+# ttk styles are shared by the whole application, so they are configured once
+_style_configured = False
+
+
+def _ensure_style():
+    """Configure the scoreboard treeview style, the first time it is needed."""
+    global _style_configured
+    if _style_configured:
+        return
+    style = ttk.Style()
+    style.configure(
+        "Scoreboard.Treeview",
+        background="#34495e",
+        foreground="white",
+        fieldbackground="#34495e",
+        rowheight=25,
+    )
+    style.configure(
+        "Scoreboard.Treeview.Heading",
+        background="#2c3e50",
+        foreground="black",
+        font=("Helvetica", 11, "bold"),
+    )
+    _style_configured = True
+
+
+def _format_time(time: str) -> str:
+    """Format an ISO timestamp from the history file as "YYYY-MM-DD HH:MM"."""
+    if len(time) >= 16 and time[10] == "T":
+        # Timestamps written by save_quiz_result already start with the
+        # date and minutes, so they can be sliced without parsing
+        return time[:10] + " " + time[11:16]
+    return datetime.fromisoformat(time).strftime("%Y-%m-%d %H:%M")
+
+
+def _format_row(entry: dict) -> tuple:
+    """Return the table values (date/time, questions, correct, percentage) for a history entry."""
+    formatted_time = _format_time(entry["time"])
+    total = entry["total"]
+    correct = entry["correct"]
+    percentage = f"{(correct / total * 100):.0f}%" if total > 0 else "0%"
+    return formatted_time, total, correct, percentage
 
 
 class ScoreboardScreen:
@@ -44,8 +95,20 @@ class ScoreboardScreen:
         spacer = tk.Frame(header_frame, width=80, bg="#2c3e50")
         spacer.pack(side="right")
 
-        # Load history
-        history = load_quiz_history()
+        # Load history off the Tk thread, with a placeholder until it arrives
+        self.loading_label = tk.Label(
+            self.frame,
+            text="Loading…",
+            font=("Helvetica", 16),
+            fg="#bdc3c7",
+            bg="#2c3e50",
+        )
+        self.loading_label.pack(expand=True)
+        run_in_background(self.frame, load_quiz_history, self._populate, self._show_load_error)
+
+    def _populate(self, history: list[dict]):
+        """Replace the loading placeholder with the history table."""
+        self.loading_label.destroy()
 
         if not history:
             # Empty state
@@ -62,21 +125,7 @@ class ScoreboardScreen:
             table_frame = tk.Frame(self.frame, bg="#2c3e50")
             table_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-            # Configure treeview style
-            style = ttk.Style()
-            style.configure(
-                "Scoreboard.Treeview",
-                background="#34495e",
-                foreground="white",
-                fieldbackground="#34495e",
-                rowheight=25,
-            )
-            style.configure(
-                "Scoreboard.Treeview.Heading",
-                background="#2c3e50",
-                foreground="black",
-                font=("Helvetica", 11, "bold"),
-            )
+            _ensure_style()
 
             # Create treeview with columns
             columns = ("datetime", "questions", "correct", "percentage")
@@ -103,23 +152,42 @@ class ScoreboardScreen:
             scrollbar = ttk.Scrollbar(
                 table_frame, orient=tk.VERTICAL, command=self.tree.yview
             )
-            self.tree.configure(yscrollcommand=scrollbar.set)
+            self.scrollbar = scrollbar
+            self.tree.configure(yscrollcommand=self._on_tree_scrolled)
+
+            # Populate the first rows (most recent first) before the table is
+            # packed, so the inserts don't trigger layout passes on a visible
+            # widget; the rest are inserted as the table is scrolled
+            self._pending_history = reversed(history)
+            self._load_more_rows()
 
             # Pack tree and scrollbar
             self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
             scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-            # Populate table (most recent first)
-            for entry in reversed(history):
-                dt = datetime.fromisoformat(entry["time"])
-                formatted_time = dt.strftime("%Y-%m-%d %H:%M")
-                total = entry["total"]
-                correct = entry["correct"]
-                percentage = f"{(correct / total * 100):.0f}%" if total > 0 else "0%"
-
-                self.tree.insert(
-                    "", tk.END, values=(formatted_time, total, correct, percentage)
-                )
+    def _show_load_error(self, error: Exception):
+        """Replace the loading placeholder with a message that the history could not be read."""
+        self.loading_label.destroy()
+        error_label = tk.Label(
+            self.frame,
+            text=f"Could not load quiz history:\n{error}",
+            font=("Helvetica", 16),
+            fg="#e74c3c",
+            bg="#2c3e50",
+        )
+        error_label.pack(expand=True)
+
+    def _load_more_rows(self):
+        """Insert the next batch of history rows at the bottom of the table."""
+        rows = [_format_row(entry) for entry in islice(self._pending_history, _ROW_BATCH)]
+        for values in rows:
+            self.tree.insert("", tk.END, values=values)
+
+    def _on_tree_scrolled(self, first: str, last: str):
+        """Update the scrollbar, loading more rows once the end is near."""
+        self.scrollbar.set(first, last)
+        if float(last) >= _LOAD_MORE_AT:
+            self._load_more_rows()
 
     def show(self):
         """Show the scoreboard screen."""
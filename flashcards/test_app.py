@@ -2,7 +2,9 @@
 """Comprehensive test suite for the Flash Card Game application."""
 
 import pytest
+import random
 import tempfile
+import threading
 import os
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch, call
@@ -10,7 +12,9 @@ import tkinter as tk
 
 # Import the modules to test
 from flashcards.app import (
+    Card,
     parse_markdown_tables,
+    parse_markdown_text,
     fix_rtl,
     MainMenu,
     FlashCardApp,
@@ -18,53 +22,97 @@ from flashcards.app import (
     ScoreboardScreen,
     App,
     load_quiz_history,
+    iter_quiz_history,
     save_quiz_result,
     get_history_path,
 )
-from flashcards.utils import spread_shuffle, spread_shuffle_with_replacement
+from flashcards.utils import (
+    calculate_font_size,
+    run_in_background,
+    start_in_background,
+    spread_shuffle,
+    spread_shuffle_with_replacement,
+    warm_rtl_cache,
+)
 
 
 # =============================================================================
 # Fixtures
 # =============================================================================
 
+_SAMPLE_CARDS = (
+    Card("hypertension", "יתר לחץ דם", "HTN", "General"),
+    Card("bradycardia", "דופק איטי", "", "General"),
+    Card("CPR", "החייאת לב ריאה", "cardiopulmonary resuscitation", "General"),
+)
+
+
 @pytest.fixture
 def sample_cards():
     """Provide sample card data for testing."""
-    return [
-        {"term": "hypertension", "interpretation": "יתר לחץ דם", "extra": "HTN", "section": "General"},
-        {"term": "bradycardia", "interpretation": "דופק איטי", "extra": "", "section": "General"},
-        {"term": "CPR", "interpretation": "החייאת לב ריאה", "extra": "cardiopulmonary resuscitation", "section": "General"},
-    ]
+    # Cards are immutable, so only the list needs to be new for each test
+    return list(_SAMPLE_CARDS)
 
 
 @pytest.fixture
 def single_card():
     """Provide a single card for simple tests."""
-    return [{"term": "test_term", "interpretation": "test_interpretation", "extra": ""}]
+    return [Card("test_term", "test_interpretation", "")]
+
+
+# Attribute names used as mock specs, looked up once rather than by
+# introspecting the Tk classes for every test
+_TK_SPEC = dir(tk.Tk)
+_FRAME_SPEC = dir(tk.Frame)
+
+
+@pytest.fixture(autouse=True)
+def fixed_seed():
+    """Seed the random module so shuffles and samples repeat from run to run."""
+    random.seed(0xC0FFEE)
+
+
+@pytest.fixture(scope="session")
+def real_deck():
+    """Parse the bundled medical-terms.md once for all tests that use it."""
+    md_file = Path(__file__).parent / "medical-terms.md"
+    if not md_file.exists():
+        pytest.skip("medical-terms.md not present")
+    return parse_markdown_tables(str(md_file))
 
 
 @pytest.fixture
 def mock_root():
     """Create a mock Tk root window."""
-    root = MagicMock(spec=tk.Tk)
-    root.winfo_exists.return_value = True
-    return root
+    return MagicMock(spec=_TK_SPEC)
 
 
 @pytest.fixture
 def mock_frame():
     """Create a mock Tk frame."""
-    frame = MagicMock(spec=tk.Frame)
+    frame = MagicMock(spec=_FRAME_SPEC)
     return frame
 
 
+def run_now(widget, func, on_done, on_error, *args):
+    """Stand-in for run_in_background that runs the call inline."""
+    try:
+        result = func(*args)
+    except Exception as error:
+        on_error(error)
+    else:
+        on_done(result)
+
+
 # =============================================================================
 # Tests for parse_markdown_tables()
 # =============================================================================
 
 class TestParseMarkdownTables:
-    """Tests for the parse_markdown_tables function."""
+    """Tests for the parse_markdown_tables and parse_markdown_text functions.
+
+    Reading from disk is covered by a few tests; the rest parse text directly.
+    """
 
     def test_parse_basic_table(self, tmp_path):
         """Test parsing a simple markdown table."""
@@ -79,16 +127,16 @@ class TestParseMarkdownTables:
         cards, sections = parse_markdown_tables(str(md_file))
 
         assert len(cards) == 2
-        assert cards[0]["term"] == "hypertension"
-        assert cards[0]["interpretation"] == "יתר לחץ דם"
-        assert cards[0]["extra"] == "HTN"
-        assert cards[0]["section"] == "General"
-        assert cards[1]["term"] == "bradycardia"
-        assert cards[1]["interpretation"] == "דופק איטי"
-        assert cards[1]["extra"] == ""
+        assert cards[0].term == "hypertension"
+        assert cards[0].interpretation == "יתר לחץ דם"
+        assert cards[0].extra == "HTN"
+        assert cards[0].section == "General"
+        assert cards[1].term == "bradycardia"
+        assert cards[1].interpretation == "דופק איטי"
+        assert cards[1].extra == ""
         assert sections == ["General"]
 
-    def test_parse_multiple_tables(self, tmp_path):
+    def test_parse_multiple_tables(self):
         """Test parsing multiple tables in one file."""
         md_content = """| Term | Interpretation |
 | ---- | -------------- |
@@ -100,34 +148,28 @@ Some text between tables
 | ---- | -------------- | ----- |
 | term2 | interp2 | extra2 |
 """
-        md_file = tmp_path / "test.md"
-        md_file.write_text(md_content, encoding="utf-8")
-
-        cards, sections = parse_markdown_tables(str(md_file))
+        cards, sections = parse_markdown_text(md_content)
 
         assert len(cards) == 2
-        assert cards[0]["term"] == "term1"
-        assert cards[0]["extra"] == ""
-        assert cards[1]["term"] == "term2"
-        assert cards[1]["extra"] == "extra2"
+        assert cards[0].term == "term1"
+        assert cards[0].extra == ""
+        assert cards[1].term == "term2"
+        assert cards[1].extra == "extra2"
         assert sections == ["General"]
 
-    def test_parse_table_with_two_columns(self, tmp_path):
+    def test_parse_table_with_two_columns(self):
         """Test parsing table with only two columns (no extra)."""
         md_content = """| Term | Interpretation |
 | ---- | -------------- |
 | IV | מתן תוך ורידי |
 | PO | מתן פומי |
 """
-        md_file = tmp_path / "test.md"
-        md_file.write_text(md_content, encoding="utf-8")
-
-        cards, sections = parse_markdown_tables(str(md_file))
+        cards, sections = parse_markdown_text(md_content)
 
         assert len(cards) == 2
-        assert cards[0]["term"] == "IV"
-        assert cards[0]["interpretation"] == "מתן תוך ורידי"
-        assert cards[0]["extra"] == ""
+        assert cards[0].term == "IV"
+        assert cards[0].interpretation == "מתן תוך ורידי"
+        assert cards[0].extra == ""
 
     def test_parse_empty_file(self, tmp_path):
         """Test parsing an empty file."""
@@ -139,7 +181,7 @@ Some text between tables
         assert cards == []
         assert sections == []
 
-    def test_parse_file_with_no_tables(self, tmp_path):
+    def test_parse_file_with_no_tables(self):
         """Test parsing a file with no tables."""
         md_content = """# Header
 
@@ -147,15 +189,12 @@ Some regular text without any tables.
 
 Another paragraph.
 """
-        md_file = tmp_path / "no_tables.md"
-        md_file.write_text(md_content, encoding="utf-8")
-
-        cards, sections = parse_markdown_tables(str(md_file))
+        cards, sections = parse_markdown_text(md_content)
 
         assert cards == []
         assert sections == []
 
-    def test_parse_table_skips_incomplete_rows(self, tmp_path):
+    def test_parse_table_skips_incomplete_rows(self):
         """Test that rows with less than 2 columns are skipped."""
         md_content = """| Term | Interpretation |
 | ---- | -------------- |
@@ -163,46 +202,78 @@ Another paragraph.
 | only_one_column |
 | another_valid | another_interp |
 """
-        md_file = tmp_path / "test.md"
-        md_file.write_text(md_content, encoding="utf-8")
-
-        cards, sections = parse_markdown_tables(str(md_file))
+        cards, sections = parse_markdown_text(md_content)
 
         # The incomplete row should be skipped
         assert len(cards) == 2
-        assert cards[0]["term"] == "valid"
-        assert cards[1]["term"] == "another_valid"
+        assert cards[0].term == "valid"
+        assert cards[1].term == "another_valid"
 
-    def test_parse_table_with_extra_whitespace(self, tmp_path):
+    def test_parse_table_keeps_empty_cells_in_place(self):
+        """Test that an empty interior cell doesn't shift later columns."""
+        md_content = """| Term | Interpretation | Extra |
+| ---- | -------------- | ----- |
+| no_interp |  | extra |
+| term | interp |  |
+|  | interp | extra |
+"""
+        cards, sections = parse_markdown_text(md_content)
+
+        # Rows without a term or interpretation are skipped
+        assert len(cards) == 1
+        assert cards[0].term == "term"
+        assert cards[0].interpretation == "interp"
+        assert cards[0].extra == ""
+
+    def test_parse_row_without_trailing_pipe(self):
+        """Test that the trailing pipe of a row is optional."""
+        md_content = """| Term | Interpretation |
+| ---- | -------------- |
+| hypoxia | חוסר חמצן ברקמות הגוף
+| term | interp | extra
+"""
+        cards, sections = parse_markdown_text(md_content)
+
+        assert len(cards) == 2
+        assert cards[0].interpretation == "חוסר חמצן ברקמות הגוף"
+        assert cards[1].extra == "extra"
+
+    def test_parse_interns_repeated_terms_and_extras(self):
+        """Test that equal terms and extras in different rows share one string object."""
+        md_content = """| Term | Interpretation | Extra |
+| ---- | -------------- | ----- |
+| cardio- | לב | pl. cardia |
+| cardio- | קשור ללב | pl. cardia |
+"""
+        cards, sections = parse_markdown_text(md_content)
+
+        assert cards[0].term is cards[1].term
+        assert cards[0].extra is cards[1].extra
+
+    def test_parse_table_with_extra_whitespace(self):
         """Test that whitespace in cells is stripped."""
         md_content = """| Term | Interpretation |
 | ---- | -------------- |
 |   spaced_term   |   spaced_interp   |
 """
-        md_file = tmp_path / "test.md"
-        md_file.write_text(md_content, encoding="utf-8")
-
-        cards, sections = parse_markdown_tables(str(md_file))
+        cards, sections = parse_markdown_text(md_content)
 
         assert len(cards) == 1
-        assert cards[0]["term"] == "spaced_term"
-        assert cards[0]["interpretation"] == "spaced_interp"
+        assert cards[0].term == "spaced_term"
+        assert cards[0].interpretation == "spaced_interp"
 
-    def test_parse_table_with_special_characters(self, tmp_path):
+    def test_parse_table_with_special_characters(self):
         """Test parsing table with special characters in content."""
         md_content = """| Term | Interpretation | Extra |
 | ---- | -------------- | ----- |
 | ecto-, exo- | מחוץ | הריון אקטופי (מחוץ לרחם) |
 | -emia | בדם | bactermia = חיידק בדם |
 """
-        md_file = tmp_path / "test.md"
-        md_file.write_text(md_content, encoding="utf-8")
-
-        cards, sections = parse_markdown_tables(str(md_file))
+        cards, sections = parse_markdown_text(md_content)
 
         assert len(cards) == 2
-        assert cards[0]["term"] == "ecto-, exo-"
-        assert cards[1]["term"] == "-emia"
+        assert cards[0].term == "ecto-, exo-"
+        assert cards[1].term == "-emia"
 
     def test_parse_preserves_hebrew_text(self, tmp_path):
         """Test that Hebrew text is preserved correctly."""
@@ -215,9 +286,9 @@ Another paragraph.
 
         cards, sections = parse_markdown_tables(str(md_file))
 
-        assert cards[0]["interpretation"] == "תורת מבנה הגוף ואיבריו"
+        assert cards[0].interpretation == "תורת מבנה הגוף ואיבריו"
 
-    def test_parse_sections(self, tmp_path):
+    def test_parse_sections(self):
         """Test parsing sections from markdown file."""
         md_content = """| Term | Interpretation |
 | ---- | -------------- |
@@ -235,16 +306,13 @@ Section Two
 | ---- | -------------- |
 | term3 | interp3 |
 """
-        md_file = tmp_path / "test.md"
-        md_file.write_text(md_content, encoding="utf-8")
-
-        cards, sections = parse_markdown_tables(str(md_file))
+        cards, sections = parse_markdown_text(md_content)
 
         assert len(cards) == 3
         assert sections == ["General", "Section One", "Section Two"]
-        assert cards[0]["section"] == "General"
-        assert cards[1]["section"] == "Section One"
-        assert cards[2]["section"] == "Section Two"
+        assert cards[0].section == "General"
+        assert cards[1].section == "Section One"
+        assert cards[2].section == "Section Two"
 
 
 # =============================================================================
@@ -319,6 +387,95 @@ class TestFixRtl:
         result = fix_rtl(text, wrap_width=25)
         assert "\n\n" in result
 
+    def test_fix_rtl_is_memoized(self):
+        """Test that repeated calls with the same text hit the cache."""
+        fix_rtl.cache_clear()
+        first = fix_rtl("יתר לחץ דם")
+        second = fix_rtl("יתר לחץ דם")
+        assert first == second
+        assert fix_rtl.cache_info().hits == 1
+
+    def test_fix_rtl_ascii_skips_bidi(self):
+        """Test that ASCII-only text is wrapped without running the bidi algorithm."""
+        fix_rtl.cache_clear()
+        with patch('flashcards.utils.get_display') as mock_get_display:
+            result = fix_rtl("chronic obstructive pulmonary disease (COPD)", 20)
+        mock_get_display.assert_not_called()
+        assert result == "chronic obstructive\npulmonary disease\n(COPD)"
+
+    def test_warm_rtl_cache_primes_card_faces(self, sample_cards):
+        """Test that warming the cache makes rendering card faces a cache hit."""
+        fix_rtl.cache_clear()
+        warm_rtl_cache(sample_cards)
+        misses = fix_rtl.cache_info().misses
+        fix_rtl(sample_cards[0].full_interpretation, 25)
+        assert fix_rtl.cache_info().misses == misses
+
+
+class TestCalculateFontSize:
+    """Tests for the calculate_font_size function."""
+
+    @pytest.mark.parametrize("text,font_size,wrap_chars", [
+        ("", 22, 25),
+        ("a" * 30, 22, 25),
+        ("a" * 31, 18, 30),
+        ("a" * 30 + "\n" * 5, 22, 25),
+        ("a" * 150, 14, 40),
+        ("a" * 151, 12, 45),
+        ("a" * 500, 8, 65),
+        ("a" * 501, 7, 70),
+    ])
+    def test_sizing_by_length(self, text, font_size, wrap_chars):
+        """Test the sizing step chosen at each length boundary, ignoring newlines."""
+        sizing = calculate_font_size(text)
+        assert sizing['font_size'] == font_size
+        assert sizing['wrap_chars'] == wrap_chars
+
+
+class TestRunInBackground:
+    """Tests for the run_in_background function."""
+
+    def test_result_delivered_through_after(self):
+        """Test that the result is polled for with after() and handed to on_done."""
+        release = threading.Event()
+        widget = MagicMock()
+        on_done = MagicMock()
+
+        run_in_background(widget, lambda x: release.wait() and x * 2, on_done, MagicMock(), 21)
+
+        # Still running: a poll is scheduled and nothing is delivered yet
+        on_done.assert_not_called()
+        assert widget.after.call_count == 1
+        release.set()
+        while not on_done.called:
+            poll = widget.after.call_args.args[1]
+            poll()
+        on_done.assert_called_once_with(42)
+
+    def test_start_in_background_returns_future(self):
+        """Test that the fire-and-forget variant runs the call on another thread."""
+        future = start_in_background(lambda: threading.current_thread())
+        assert future.result(timeout=5) is not threading.current_thread()
+
+    def test_exception_delivered_to_on_error(self):
+        """Test that an exception raised by the call is handed to on_error, not on_done."""
+        widget = MagicMock()
+        on_done = MagicMock()
+        on_error = MagicMock()
+        error = UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+        def fail():
+            raise error
+
+        run_in_background(widget, fail, on_done, on_error)
+        while not on_error.called:
+            poll = widget.after.call_args.args[1]
+            poll()
+
+        on_error.assert_called_once_with(error)
+        on_done.assert_not_called()
+
+
 # =============================================================================
 # Tests for spread_shuffle functions
 # =============================================================================
@@ -333,22 +490,22 @@ class TestSpreadShuffle:
 
     def test_spread_shuffle_single_card(self):
         """Test spread_shuffle with single card."""
-        cards = [{"term": "a", "section": "A"}]
+        cards = [Card("a", "", section="A")]
         result = spread_shuffle(cards)
         assert len(result) == 1
-        assert result[0]["term"] == "a"
+        assert result[0].term == "a"
 
     def test_spread_shuffle_preserves_all_cards(self):
         """Test that spread_shuffle preserves all cards."""
         cards = [
-            {"term": "a1", "section": "A"},
-            {"term": "a2", "section": "A"},
-            {"term": "b1", "section": "B"},
-            {"term": "b2", "section": "B"},
+            Card("a1", "", section="A"),
+            Card("a2", "", section="A"),
+            Card("b1", "", section="B"),
+            Card("b2", "", section="B"),
         ]
         result = spread_shuffle(cards)
         assert len(result) == 4
-        result_terms = {c["term"] for c in result}
+        result_terms = {c.term for c in result}
         expected_terms = {"a1", "a2", "b1", "b2"}
         assert result_terms == expected_terms
 
@@ -356,12 +513,12 @@ class TestSpreadShuffle:
         """Test that spread_shuffle spreads sections apart."""
         # Create cards heavily weighted to one section
         cards = [
-            {"term": "a1", "section": "A"},
-            {"term": "a2", "section": "A"},
-            {"term": "a3", "section": "A"},
-            {"term": "a4", "section": "A"},
-            {"term": "b1", "section": "B"},
-            {"term": "b2", "section": "B"},
+            Card("a1", "", section="A"),
+            Card("a2", "", section="A"),
+            Card("a3", "", section="A"),
+            Card("a4", "", section="A"),
+            Card("b1", "", section="B"),
+            Card("b2", "", section="B"),
         ]
         # Run multiple times to verify spreading behavior
         max_consecutive_same_section = 0
@@ -369,7 +526,7 @@ class TestSpreadShuffle:
             result = spread_shuffle(cards.copy())
             consecutive = 1
             for i in range(1, len(result)):
-                if result[i]["section"] == result[i-1]["section"]:
+                if result[i].section == result[i-1].section:
                     consecutive += 1
                     max_consecutive_same_section = max(max_consecutive_same_section, consecutive)
                 else:
@@ -379,19 +536,31 @@ class TestSpreadShuffle:
         # (can happen when one section is exhausted)
         assert max_consecutive_same_section <= 3
 
+    def test_spread_shuffle_uneven_sections(self):
+        """Test that sections of different sizes are merged one card per section per round."""
+        cards = [Card(f"{section}{i}", "", section=section)
+                 for section, size in (("A", 5), ("B", 1), ("C", 3))
+                 for i in range(size)]
+        result = spread_shuffle(cards)
+
+        assert sorted(c.term for c in result) == sorted(c.term for c in cards)
+        assert {c.section for c in result[:3]} == {"A", "B", "C"}
+        assert {c.section for c in result[3:5]} == {"A", "C"}
+        assert [c.section for c in result[7:]] == ["A", "A"]
+
     def test_spread_shuffle_single_section(self):
         """Test spread_shuffle when all cards are from same section."""
         cards = [
-            {"term": "a1", "section": "A"},
-            {"term": "a2", "section": "A"},
-            {"term": "a3", "section": "A"},
+            Card("a1", "", section="A"),
+            Card("a2", "", section="A"),
+            Card("a3", "", section="A"),
         ]
         result = spread_shuffle(cards)
         assert len(result) == 3
 
     def test_spread_shuffle_returns_new_list(self):
         """Test that spread_shuffle returns a new list."""
-        cards = [{"term": "a", "section": "A"}, {"term": "b", "section": "B"}]
+        cards = [Card("a", "", section="A"), Card("b", "", section="B")]
         result = spread_shuffle(cards)
         assert result is not cards
 
@@ -407,40 +576,37 @@ class TestSpreadShuffleWithReplacement:
     def test_samples_correct_count(self):
         """Test that correct number of cards are sampled."""
         cards = [
-            {"term": "a", "section": "A"},
-            {"term": "b", "section": "B"},
+            Card("a", "", section="A"),
+            Card("b", "", section="B"),
         ]
         result = spread_shuffle_with_replacement(cards, 10)
         assert len(result) == 10
 
     def test_samples_more_than_available(self):
         """Test sampling more cards than available (with replacement)."""
-        cards = [{"term": "only", "section": "A"}]
+        cards = [Card("only", "", section="A")]
         result = spread_shuffle_with_replacement(cards, 5)
         assert len(result) == 5
         # All cards should be the same since only one exists
         for card in result:
-            assert card["term"] == "only"
+            assert card.term == "only"
 
     def test_preserves_card_structure(self):
         """Test that card structure is preserved."""
         cards = [
-            {"term": "a", "interpretation": "interp_a", "extra": "ex", "section": "A"},
+            Card("a", "interp_a", "ex", "A"),
         ]
         result = spread_shuffle_with_replacement(cards, 3)
         for card in result:
-            assert "term" in card
-            assert "interpretation" in card
-            assert "extra" in card
-            assert "section" in card
+            assert card == cards[0]
 
     def test_spreads_sections_after_sampling(self):
         """Test that sections are spread apart after sampling."""
         cards = [
-            {"term": "a1", "section": "A"},
-            {"term": "a2", "section": "A"},
-            {"term": "b1", "section": "B"},
-            {"term": "b2", "section": "B"},
+            Card("a1", "", section="A"),
+            Card("a2", "", section="A"),
+            Card("b1", "", section="B"),
+            Card("b2", "", section="B"),
         ]
         # Sample many cards to test spreading
         result = spread_shuffle_with_replacement(cards, 20)
@@ -450,7 +616,7 @@ class TestSpreadShuffleWithReplacement:
         max_consecutive = 1
         consecutive = 1
         for i in range(1, len(result)):
-            if result[i]["section"] == result[i-1]["section"]:
+            if result[i].section == result[i-1].section:
                 consecutive += 1
                 max_consecutive = max(max_consecutive, consecutive)
             else:
@@ -459,6 +625,43 @@ class TestSpreadShuffleWithReplacement:
         # Should be reasonably spread (not all same section together)
         assert max_consecutive < len(result)
 
+    def test_no_duplicates_when_enough_cards(self):
+        """Test that sampling up to the deck size draws distinct cards."""
+        cards = [Card(f"t{i}", "", section="AB"[i % 2]) for i in range(20)]
+        result = spread_shuffle_with_replacement(cards, 15)
+        assert len(result) == 15
+        assert len({card.term for card in result}) == 15
+
+        result = spread_shuffle_with_replacement(cards, 20)
+        assert sorted(card.term for card in result) == sorted(card.term for card in cards)
+
+    def test_sampled_groups_not_reshuffled(self):
+        """Test that only the section order is shuffled after sampling."""
+        cards = [
+            Card("a1", "", section="A"),
+            Card("b1", "", section="B"),
+            Card("c1", "", section="C"),
+        ]
+        with patch('flashcards.utils.random.shuffle') as mock_shuffle:
+            result = spread_shuffle_with_replacement(cards, 30)
+        assert len(result) == 30
+        assert mock_shuffle.call_count == 1
+
+    def test_sampling_is_uniform(self):
+        """Test that every card is drawn with roughly equal frequency."""
+        cards = [
+            Card("a1", "", section="A"),
+            Card("a2", "", section="A"),
+            Card("b1", "", section="B"),
+        ]
+        result = spread_shuffle_with_replacement(cards, 3000)
+        counts = {card.term: 0 for card in cards}
+        for card in result:
+            counts[card.term] += 1
+        # Expected 1000 each; the standard deviation is about 26
+        for count in counts.values():
+            assert 850 < count < 1150
+
 
 # =============================================================================
 # Tests for MainMenu class
@@ -492,6 +695,61 @@ class TestMainMenu:
         assert menu.start_quiz_mode == quiz_cb
         assert menu.start_scoreboard_mode == scoreboard_cb
 
+    @pytest.mark.parametrize("section_counts,loading,state", [
+        ({}, True, tk.DISABLED),
+        ({}, False, tk.NORMAL),
+        ({"General": 3}, False, tk.NORMAL),
+    ])
+    @patch('tkinter.Frame')
+    @patch('tkinter.Label')
+    @patch('tkinter.Button')
+    @patch('tkinter.Spinbox')
+    @patch('tkinter.IntVar')
+    @patch('tkinter.Canvas')
+    @patch('tkinter.Scrollbar')
+    @patch('tkinter.BooleanVar')
+    @patch('tkinter.Checkbutton')
+    def test_mode_buttons_wait_for_deck(self, mock_checkbutton, mock_boolvar, mock_scrollbar,
+                                        mock_canvas, mock_intvar, mock_spinbox, mock_button,
+                                        mock_label, mock_frame, section_counts, loading, state):
+        """Test that the card mode buttons are disabled only while the deck is loading."""
+        MainMenu(MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), section_counts,
+                 loading=loading)
+
+        states = {c.kwargs["text"]: c.kwargs.get("state") for c in mock_button.call_args_list}
+        assert states["Simple Mode"] == state
+        assert states["Inverted Mode"] == state
+        assert states["Quiz Mode"] == state
+        assert states["Scoreboard"] is None
+
+    @pytest.mark.parametrize("section_counts,loading,has_cards,status", [
+        ({}, True, False, "Loading…"),
+        ({}, False, False, "No cards found"),
+        ({}, False, True, None),
+        ({"General": 3}, False, True, None),
+    ])
+    @patch('tkinter.Frame')
+    @patch('tkinter.Label')
+    @patch('tkinter.Button')
+    @patch('tkinter.Spinbox')
+    @patch('tkinter.IntVar')
+    @patch('tkinter.Canvas')
+    @patch('tkinter.Scrollbar')
+    @patch('tkinter.BooleanVar')
+    @patch('tkinter.Checkbutton')
+    def test_status_in_place_of_sections(self, mock_checkbutton, mock_boolvar, mock_scrollbar,
+                                         mock_canvas, mock_intvar, mock_spinbox, mock_button,
+                                         mock_label, mock_frame, section_counts, loading,
+                                         has_cards, status):
+        """Test the loading and empty-deck messages shown instead of the sections list."""
+        MainMenu(MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), section_counts,
+                 loading=loading, has_cards=has_cards)
+
+        texts = [c.kwargs.get("text") for c in mock_label.call_args_list]
+        assert ("Loading…" in texts) == (status == "Loading…")
+        assert ("No cards found" in texts) == (status == "No cards found")
+        assert ("Sections:" in texts) == bool(section_counts)
+
     @patch('tkinter.Frame')
     @patch('tkinter.Label')
     @patch('tkinter.Button')
@@ -582,11 +840,45 @@ class TestMainMenu:
         menu._uncheck_all()
         for var in menu.section_vars.values():
             var.set.assert_called_with(False)
+        assert menu.get_selected_sections() == set()
 
         # Test check all
         menu._check_all()
         for var in menu.section_vars.values():
             var.set.assert_called_with(True)
+        assert menu.get_selected_sections() == {"General", "Section1"}
+
+    @patch('tkinter.Frame')
+    @patch('tkinter.Label')
+    @patch('tkinter.Button')
+    @patch('tkinter.Spinbox')
+    @patch('tkinter.IntVar')
+    @patch('tkinter.BooleanVar')
+    @patch('tkinter.Canvas')
+    @patch('tkinter.Scrollbar')
+    @patch('tkinter.Checkbutton')
+    def test_section_toggle_updates_selection(self, mock_checkbutton, mock_scrollbar, mock_canvas,
+                                              mock_boolvar, mock_intvar, mock_spinbox, mock_button,
+                                              mock_label, mock_frame):
+        """Test that clicking a section checkbox updates the selection without re-reading all boxes."""
+        mock_intvar.return_value = MagicMock()
+        mock_boolvar.side_effect = lambda value: MagicMock(**{"get.return_value": value})
+        mock_canvas.return_value = MagicMock()
+
+        parent = MagicMock()
+        section_counts = {"General": 10, "Section1": 5}
+        menu = MainMenu(parent, MagicMock(), MagicMock(), MagicMock(), MagicMock(), section_counts=section_counts)
+        commands = [c.kwargs["command"] for c in mock_checkbutton.call_args_list]
+
+        # Clicking the box toggles its variable, then runs its command
+        menu.section_vars["Section1"].get.return_value = False
+        commands[1]()
+        assert menu.get_selected_sections() == {"General"}
+
+        menu.section_vars["Section1"].get.return_value = True
+        commands[1]()
+        assert menu.get_selected_sections() == {"General", "Section1"}
+        menu.section_vars["General"].get.assert_not_called()
 
     @patch('tkinter.Frame')
     @patch('tkinter.Label')
@@ -648,6 +940,23 @@ class TestFlashCardApp:
 
         assert app.mode == "inverted"
 
+    @patch('tkinter.Frame')
+    @patch('tkinter.Label')
+    @patch('tkinter.Button')
+    def test_card_faces_precomputed(self, mock_button, mock_label, mock_frame,
+                                    mock_root, sample_cards):
+        """Test that card faces are rendered once at construction."""
+        mock_frame.return_value = MagicMock()
+        mock_label.return_value = MagicMock()
+        mock_button.return_value = MagicMock()
+
+        app = FlashCardApp(mock_root, sample_cards, mode="simple")
+
+        assert len(app._faces) == len(sample_cards)
+        front, back = app._faces[sample_cards[0]]
+        assert front["text"] == "hypertension"
+        assert back["text"] == fix_rtl("יתר לחץ דם\n\n(HTN)", 25)
+
     @patch('tkinter.Frame')
     @patch('tkinter.Label')
     @patch('tkinter.Button')
@@ -734,6 +1043,68 @@ class TestFlashCardApp:
         app._flip_card()
         assert app.is_flipped == False
 
+    @patch('tkinter.Frame')
+    @patch('tkinter.Label')
+    @patch('tkinter.Button')
+    def test_flip_configures_term_label_once(self, mock_button, mock_label, mock_frame,
+                                             mock_root, sample_cards):
+        """Test that flipping applies the back face in a single configure."""
+        mock_frame.return_value = MagicMock()
+        mock_label.return_value = MagicMock()
+        mock_button.return_value = MagicMock()
+
+        app = FlashCardApp(mock_root, sample_cards, mode="simple")
+        app.term_label = MagicMock()
+        app._flip_card()
+
+        app.term_label.config.assert_called_once()
+        kwargs = app.term_label.config.call_args[1]
+        assert kwargs["fg"] == "#27ae60"
+        assert kwargs["bg"] == "#d5f5e3"
+        assert kwargs["text"] == app._faces[sample_cards[0]][1]["text"]
+
+    @patch('tkinter.Frame')
+    @patch('tkinter.Label')
+    @patch('tkinter.Button')
+    def test_navigation_burst_redraws_once(self, mock_button, mock_label, mock_frame,
+                                           mock_root, sample_cards):
+        """Test that rapid navigation schedules a single redraw of the final card."""
+        mock_frame.return_value = MagicMock()
+        mock_label.return_value = MagicMock()
+        mock_button.return_value = MagicMock()
+
+        app = FlashCardApp(mock_root, sample_cards, mode="simple")
+        app.term_label = MagicMock()
+        app._next_card()
+        app._next_card()
+        app._prev_card()
+        app._next_card()
+
+        mock_root.after.assert_called_once()
+        app.term_label.config.assert_not_called()
+
+        redraw = mock_root.after.call_args[0][1]
+        redraw()
+        assert app.term_label.config.call_args[1]["text"] == app._faces[sample_cards[2]][0]["text"]
+
+    @patch('tkinter.Frame')
+    @patch('tkinter.Label')
+    @patch('tkinter.Button')
+    def test_faces_survive_shuffle(self, mock_button, mock_label, mock_frame,
+                                   mock_root, sample_cards):
+        """Test that shuffling and revisiting cards reuses the rendered faces."""
+        mock_frame.return_value = MagicMock()
+        mock_label.return_value = MagicMock()
+        mock_button.return_value = MagicMock()
+
+        app = FlashCardApp(mock_root, sample_cards.copy(), mode="simple")
+        with patch.object(app, '_card_faces') as mock_card_faces:
+            app._shuffle_cards()
+            app._flip_card()
+            app._next_card()
+            app._prev_card()
+            mock_card_faces.assert_not_called()
+
     @patch('tkinter.Frame')
     @patch('tkinter.Label')
     @patch('tkinter.Button')
@@ -762,18 +1133,12 @@ class TestFlashCardApp:
         mock_button.return_value = MagicMock()
 
         app = FlashCardApp(mock_root, sample_cards.copy(), mode="simple")
-        original_first = app.cards[0]["term"]
+        app._next_card()
 
-        # Shuffle multiple times to ensure we get a different order
-        shuffled = False
-        for _ in range(10):
-            app._shuffle_cards()
-            if app.cards[0]["term"] != original_first:
-                shuffled = True
-                break
+        # random is seeded for every test, so the shuffled order is fixed
+        app._shuffle_cards()
 
-        # With 3 cards, probability of same first card after 10 shuffles is (1/3)^10
-        # This test might rarely fail due to randomness
+        assert [card.term for card in app.cards] == ["bradycardia", "hypertension", "CPR"]
         assert app.current_index == 0  # Shuffle resets index
         assert app.is_flipped == False  # Shuffle resets flip state
 
@@ -797,20 +1162,18 @@ class TestFlashCardApp:
     @patch('tkinter.Frame')
     @patch('tkinter.Label')
     @patch('tkinter.Button')
-    def test_original_order_preserved(self, mock_button, mock_label, mock_frame,
-                                       mock_root, sample_cards):
-        """Test that original_order is preserved after shuffle."""
+    def test_shuffle_keeps_all_cards(self, mock_button, mock_label, mock_frame,
+                                     mock_root, sample_cards):
+        """Test that shuffling reorders the deck without dropping cards."""
         mock_frame.return_value = MagicMock()
         mock_label.return_value = MagicMock()
         mock_button.return_value = MagicMock()
 
-        cards_copy = sample_cards.copy()
-        app = FlashCardApp(mock_root, cards_copy, mode="simple")
-
-        original = app.original_order.copy()
+        app = FlashCardApp(mock_root, sample_cards.copy(), mode="simple")
         app._shuffle_cards()
 
-        assert app.original_order == original
+        assert sorted(c.term for c in app.cards) == sorted(c.term for c in sample_cards)
+        assert not hasattr(app, "original_order")
 
 
 # =============================================================================
@@ -877,79 +1240,101 @@ class TestQuizCardApp:
         app._next_card()
         assert app.current_index == len(sample_cards) - 1
 
+    @patch('tkinter.Frame')
+    @patch('tkinter.Label')
+    @patch('tkinter.Button')
+    @patch('tkinter.Entry')
+    def test_submit_uses_precomputed_correct_terms(self, mock_entry, mock_button, mock_label,
+                                                   mock_frame, mock_root):
+        """Test that correct terms are normalized once per card and used on submit."""
+        mock_frame.return_value = MagicMock()
+        mock_label.return_value = MagicMock()
+        mock_button.return_value = MagicMock()
+        mock_entry_instance = MagicMock()
+        mock_entry_instance.get.return_value = " Ecto- "
+        mock_entry.return_value = mock_entry_instance
+        cards = [Card("ecto-, Exo-", "x")]
+
+        app = QuizCardApp(mock_root, cards)
+        assert app._correct_terms == {cards[0]: frozenset({"ecto", "exo"})}
+        # A later quiz over the same card reuses the normalized set
+        assert QuizCardApp(mock_root, cards)._correct_terms[cards[0]] is app._correct_terms[cards[0]]
+
+        # Nothing to clear before the first answer
+        assert app._feedback_shown == False
+        app.result_box.config.assert_not_called()
+
+        app._submit_answer()
+        assert app.correct_count == 1
+        assert app._feedback_shown == True
+        app.result_msg_label.config.assert_any_call(
+            text="Correct! Full answer: ", bg="#27ae60"
+        )
+
+
+    @patch('tkinter.Frame')
+    @patch('tkinter.Label')
+    @patch('tkinter.Button')
+    @patch('tkinter.Entry')
+    def test_submit_without_cards_is_ignored(self, mock_entry, mock_button, mock_label,
+                                             mock_frame, mock_root):
+        """Test that submitting before a deck has loaded does nothing."""
+        mock_frame.return_value = MagicMock()
+        mock_label.return_value = MagicMock()
+        mock_button.return_value = MagicMock()
+        mock_entry.return_value = MagicMock()
+
+        app = QuizCardApp(mock_root, [])
+        app._submit_answer()
+
+        assert app.current_answered == False
+        assert app.correct_count == 0
+
 
 # =============================================================================
 # Tests for Quiz Answer Validation Logic
 # =============================================================================
 
 class TestQuizAnswerValidation:
-    """Tests for quiz answer validation logic (extracted for unit testing)."""
-
-    def normalize(self, s):
-        """Normalize answer string (matches implementation)."""
-        return s.strip().lower().replace("-", "")
-
-    def check_answer(self, user_answer, correct_term):
-        """Check answer logic (matches _submit_answer implementation)."""
-        user_terms = {self.normalize(t) for t in user_answer.split(",") if self.normalize(t)}
-        correct_terms = {self.normalize(t) for t in correct_term.split(",") if self.normalize(t)}
-
-        if user_terms == correct_terms:
-            return "correct"
-        elif user_terms and user_terms.issubset(correct_terms):
-            return "partial"
-        else:
-            return "incorrect"
-
-    def test_exact_match(self):
-        """Test exact match returns correct."""
-        assert self.check_answer("hypertension", "hypertension") == "correct"
-
-    def test_case_insensitive(self):
-        """Test case insensitivity."""
-        assert self.check_answer("HYPERTENSION", "hypertension") == "correct"
-        assert self.check_answer("HyPerTension", "hypertension") == "correct"
-
-    def test_dash_insensitive(self):
-        """Test dash insensitivity."""
-        assert self.check_answer("brady-cardia", "bradycardia") == "correct"
-        assert self.check_answer("bradycardia", "brady-cardia") == "correct"
-        assert self.check_answer("brady-cardia", "brady-cardia") == "correct"
-
-    def test_whitespace_stripped(self):
-        """Test leading/trailing whitespace is stripped."""
-        assert self.check_answer("  hypertension  ", "hypertension") == "correct"
-
-    def test_comma_separated_exact_match(self):
-        """Test comma-separated terms exact match."""
-        assert self.check_answer("term1, term2", "term1, term2") == "correct"
-        assert self.check_answer("term2, term1", "term1, term2") == "correct"  # Order doesn't matter
-
-    def test_comma_separated_partial_match(self):
-        """Test comma-separated terms partial match."""
-        assert self.check_answer("term1", "term1, term2") == "partial"
-
-    def test_incorrect_answer(self):
-        """Test incorrect answer."""
-        assert self.check_answer("wrong", "correct") == "incorrect"
-
-    def test_empty_answer(self):
-        """Test empty answer."""
-        assert self.check_answer("", "correct") == "incorrect"
-
-    def test_partial_with_extra_term(self):
-        """Test that extra terms result in incorrect."""
-        assert self.check_answer("term1, term3", "term1, term2") == "incorrect"
-
-    def test_complex_medical_term(self):
-        """Test complex medical terms with prefixes/suffixes."""
-        assert self.check_answer("ecto-, exo-", "ecto-, exo-") == "correct"
-        assert self.check_answer("ectoexo", "ecto-, exo-") == "incorrect"  # Not the same when normalized
-
-    def test_abbreviations(self):
-        """Test medical abbreviations."""
-        assert self.check_answer("cpr", "CPR") == "correct"
-        assert self.check_answer("IV", "iv") == "correct"
+    """Tests for quiz answer validation logic."""
+
+    @staticmethod
+    def check_answer(user_answer, correct_term):
+        """Grade an answer the way _submit_answer does."""
+        from flashcards.screens.quiz import _answer_terms, _grade_answer
+
+        return _grade_answer(_answer_terms(user_answer), _answer_terms(correct_term))
+
+    @pytest.mark.parametrize("user_answer, correct_term, expected", [
+        # Exact match
+        ("hypertension", "hypertension", "correct"),
+        # Case insensitivity
+        ("HYPERTENSION", "hypertension", "correct"),
+        ("HyPerTension", "hypertension", "correct"),
+        # Dash insensitivity
+        ("brady-cardia", "bradycardia", "correct"),
+        ("bradycardia", "brady-cardia", "correct"),
+        ("brady-cardia", "brady-cardia", "correct"),
+        # Leading/trailing whitespace is stripped
+        ("  hypertension  ", "hypertension", "correct"),
+        # Comma-separated terms, in any order
+        ("term1, term2", "term1, term2", "correct"),
+        ("term2, term1", "term1, term2", "correct"),
+        ("term1", "term1, term2", "partial"),
+        # Wrong, empty, or extra terms
+        ("wrong", "correct", "incorrect"),
+        ("", "correct", "incorrect"),
+        ("term1, term3", "term1, term2", "incorrect"),
+        # Prefixes/suffixes are not the same once dashes are dropped and joined
+        ("ecto-, exo-", "ecto-, exo-", "correct"),
+        ("ectoexo", "ecto-, exo-", "incorrect"),
+        # Abbreviations
+        ("cpr", "CPR", "correct"),
+        ("IV", "iv", "correct"),
+    ])
+    def test_check_answer(self, user_answer, correct_term, expected):
+        """Test answer grading across case, dashes, whitespace and term lists."""
+        assert self.check_answer(user_answer, correct_term) == expected
 
 
 # =============================================================================
@@ -968,6 +1353,26 @@ class TestLoadQuizHistory:
         result = load_quiz_history()
         assert result == []
 
+    def test_iter_quiz_history_yields_tuples(self, tmp_path, monkeypatch):
+        """Test iterating history rows as tuples, skipping blank lines."""
+        history_file = tmp_path / "history.csv"
+        history_file.write_text(
+            "time,number_of_questions,number_of_correct_answers\n"
+            "2024-01-15T10:30:00,20,15\n"
+            "\n"
+            "2024-01-16T14:00:00,30,28\n",
+            encoding="utf-8"
+        )
+        monkeypatch.setattr(
+            "flashcards.history.get_history_path",
+            lambda: history_file
+        )
+
+        rows = iter_quiz_history()
+
+        assert next(rows) == ("2024-01-15T10:30:00", 20, 15)
+        assert list(rows) == [("2024-01-16T14:00:00", 30, 28)]
+
     def test_load_quiz_history_with_data(self, tmp_path, monkeypatch):
         """Test loading history with valid data."""
         history_file = tmp_path / "history.csv"
@@ -1007,6 +1412,32 @@ class TestLoadQuizHistory:
         result = load_quiz_history()
         assert result == []
 
+    def test_load_quiz_history_reuses_unchanged_file(self, tmp_path, monkeypatch):
+        """Test that an unchanged history file is parsed once, a changed one again, and entries aren't shared."""
+        history_file = tmp_path / "history.csv"
+        monkeypatch.setattr(
+            "flashcards.history.get_history_path",
+            lambda: history_file
+        )
+        save_quiz_result(20, 15)
+        first = load_quiz_history()
+
+        def fail_open(*args, **kwargs):
+            raise AssertionError("unchanged history file was re-read")
+
+        with monkeypatch.context() as m:
+            m.setattr("flashcards.history.open", fail_open, raising=False)
+            assert load_quiz_history() == first
+
+            # Entries are built per call, so changing one doesn't leak into the cache
+            first[0]["total"] = 99
+            assert load_quiz_history()[0]["total"] == 20
+
+        save_quiz_result(30, 28)
+        result = load_quiz_history()
+
+        assert [entry["total"] for entry in result] == [20, 30]
+
 
 class TestSaveQuizResult:
     """Tests for the save_quiz_result function."""
@@ -1086,6 +1517,36 @@ class TestSaveQuizResult:
         header_count = content.count("time,number_of_questions")
         assert header_count == 1
 
+    def test_rows_match_csv_writer_format(self, tmp_path, monkeypatch):
+        """Test that saved rows use the same CRLF CSV format as csv.writer and load back."""
+        history_file = tmp_path / "history.csv"
+        monkeypatch.setattr(
+            "flashcards.history.get_history_path",
+            lambda: history_file
+        )
+
+        save_quiz_result(total=10, correct=8)
+
+        raw = history_file.read_bytes()
+        assert raw.startswith(b"time,number_of_questions,number_of_correct_answers\r\n")
+        assert raw.endswith(b",10,8\r\n")
+        assert [(e["total"], e["correct"]) for e in load_quiz_history()] == [(10, 8)]
+
+    def test_writes_headers_to_existing_empty_file(self, tmp_path, monkeypatch):
+        """Test that an existing but empty history file still gets headers."""
+        history_file = tmp_path / "history.csv"
+        history_file.touch()
+        monkeypatch.setattr(
+            "flashcards.history.get_history_path",
+            lambda: history_file
+        )
+
+        save_quiz_result(total=10, correct=8)
+
+        lines = history_file.read_text().strip().split("\n")
+        assert lines[0] == "time,number_of_questions,number_of_correct_answers"
+        assert len(lines) == 2
+
     def test_writes_iso_timestamp(self, tmp_path, monkeypatch):
         """Test that timestamp is in ISO format."""
         history_file = tmp_path / "history.csv"
@@ -1137,7 +1598,7 @@ class TestQuizResultsScreen:
 
         # Check that label was called with correct percentage
         label_calls = mock_label.call_args_list
-        score_call = [c for c in label_calls if "80%" in str(c)]
+        score_call = [c for c in label_calls if "80%" in c.kwargs.get("text", "")]
         assert len(score_call) == 1
 
     @patch('tkinter.Frame')
@@ -1202,7 +1663,7 @@ class TestQuizResultsScreen:
         screen = QuizResultsScreen(mock_root, correct_count=10, total=10)
 
         label_calls = mock_label.call_args_list
-        score_call = [c for c in label_calls if "100%" in str(c)]
+        score_call = [c for c in label_calls if "100%" in c.kwargs.get("text", "")]
         assert len(score_call) == 1
 
 
@@ -1210,7 +1671,7 @@ class TestQuizCompletionFlow:
     """Tests for the quiz completion flow - results screen + history saving."""
 
     @patch('flashcards.controller.save_quiz_result')
-    @patch('flashcards.controller.QuizResultsScreen')
+    @patch('flashcards.screens.quiz_results.QuizResultsScreen')
     @patch('tkinter.Frame')
     @patch('tkinter.Label')
     @patch('tkinter.Button')
@@ -1239,7 +1700,7 @@ class TestQuizCompletionFlow:
         mock_save.assert_called_once_with(10, 8)
 
     @patch('flashcards.controller.save_quiz_result')
-    @patch('flashcards.controller.QuizResultsScreen')
+    @patch('flashcards.screens.quiz_results.QuizResultsScreen')
     @patch('tkinter.Frame')
     @patch('tkinter.Label')
     @patch('tkinter.Button')
@@ -1271,7 +1732,7 @@ class TestQuizCompletionFlow:
         mock_results_instance.show.assert_called_once()
 
     @patch('flashcards.controller.save_quiz_result')
-    @patch('flashcards.controller.QuizResultsScreen')
+    @patch('flashcards.screens.quiz_results.QuizResultsScreen')
     @patch('tkinter.Frame')
     @patch('tkinter.Label')
     @patch('tkinter.Button')
@@ -1305,7 +1766,7 @@ class TestQuizCompletionFlow:
         assert app.flashcard_app is None
 
     @patch('flashcards.controller.save_quiz_result')
-    @patch('flashcards.controller.QuizResultsScreen')
+    @patch('flashcards.screens.quiz_results.QuizResultsScreen')
     @patch('tkinter.Frame')
     @patch('tkinter.Label')
     @patch('tkinter.Button')
@@ -1338,10 +1799,58 @@ class TestQuizCompletionFlow:
         mock_results_instance.hide.assert_called_once()
         assert app.results_screen is None
 
+    @patch('flashcards.controller.save_quiz_result')
+    @patch('flashcards.screens.quiz_results.QuizResultsScreen')
+    @patch('tkinter.Frame')
+    @patch('tkinter.Label')
+    @patch('tkinter.Button')
+    @patch('tkinter.Spinbox')
+    @patch('tkinter.IntVar')
+    @patch('tkinter.BooleanVar')
+    @patch('tkinter.Canvas')
+    @patch('tkinter.Scrollbar')
+    @patch('tkinter.Checkbutton')
+    def test_return_key_forwarded_to_active_screen(self, mock_checkbutton, mock_scrollbar, mock_canvas,
+                                                   mock_boolvar, mock_intvar, mock_spinbox, mock_button,
+                                                   mock_label, mock_frame, mock_results_screen,
+                                                   mock_save, mock_root, sample_cards):
+        """Test that <Return> is bound once by the App and reaches the quiz, then the results."""
+        mock_frame.return_value = MagicMock()
+        mock_canvas.return_value = MagicMock()
+        mock_boolvar.return_value = MagicMock()
+        mock_results_instance = MagicMock()
+        mock_results_screen.return_value = mock_results_instance
+
+        app = App(mock_root, sample_cards)
+        bindings = {c[0][0]: c[0][1] for c in mock_root.bind.call_args_list}
+
+        # Nothing to forward to while the menu is shown
+        bindings["<Return>"](None)
+
+        app.flashcard_app = MagicMock()
+        bindings["<Return>"](None)
+        app.flashcard_app._handle_return.assert_called_once()
+
+        app._on_quiz_complete(correct=8, total=10)
+        bindings["<Return>"](None)
+        mock_results_instance._handle_return.assert_called_once()
+        assert [c[0][0] for c in mock_root.bind.call_args_list].count("<Return>") == 1
+
 
 class TestScoreboardScreen:
     """Tests for the ScoreboardScreen class."""
 
+    def test_format_time_matches_datetime_formatting(self):
+        """Test that sliced timestamps match datetime formatting, with a parsing fallback."""
+        from datetime import datetime
+        from flashcards.screens.scoreboard import _format_time
+
+        for time in ("2024-01-15T10:30:00", "2024-01-15T10:30:59.123456",
+                     "2024-12-31T23:59:00+02:00", "2024-01-15 10:30:00", "2024-01-15"):
+            expected = datetime.fromisoformat(time).strftime("%Y-%m-%d %H:%M")
+            assert _format_time(time) == expected
+
+    @patch('flashcards.screens.scoreboard.run_in_background', run_now)
     @patch('flashcards.screens.scoreboard.load_quiz_history')
     @patch('tkinter.Frame')
     @patch('tkinter.Label')
@@ -1364,6 +1873,27 @@ class TestScoreboardScreen:
                        if call.kwargs.get('text') == 'No quiz history yet']
         assert len(label_calls) == 1
 
+    @patch('flashcards.screens.scoreboard.run_in_background', run_now)
+    @patch('flashcards.screens.scoreboard.load_quiz_history')
+    @patch('tkinter.Frame')
+    @patch('tkinter.Label')
+    @patch('tkinter.Button')
+    def test_load_error_replaces_placeholder(self, mock_button, mock_label, mock_frame,
+                                             mock_load_history):
+        """Test that a history file that can't be read shows an error instead of the placeholder."""
+        mock_load_history.side_effect = ValueError("invalid literal for int() with base 10: 'x'")
+        mock_frame.return_value = MagicMock()
+        mock_label.return_value = MagicMock()
+        mock_button.return_value = MagicMock()
+
+        screen = ScoreboardScreen(MagicMock(), MagicMock())
+
+        screen.loading_label.destroy.assert_called_once()
+        error_calls = [c for c in mock_label.call_args_list
+                       if "Could not load quiz history" in c.kwargs.get("text", "")]
+        assert len(error_calls) == 1
+
+    @patch('flashcards.screens.scoreboard.run_in_background', run_now)
     @patch('flashcards.screens.scoreboard.load_quiz_history')
     @patch('tkinter.ttk.Treeview')
     @patch('tkinter.ttk.Scrollbar')
@@ -1399,8 +1929,95 @@ class TestScoreboardScreen:
         assert call_kwargs["columns"] == ("datetime", "questions", "correct", "percentage")
 
         # Verify rows were inserted (2 entries, inserted in reverse order)
-        assert mock_tree_instance.insert.call_count == 2
+        assert mock_tree_instance.insert.call_args_list == [
+            call("", tk.END, values=("2024-01-16 14:00", 30, 28, "93%")),
+            call("", tk.END, values=("2024-01-15 10:30", 20, 15, "75%")),
+        ]
+
+    @patch('flashcards.screens.scoreboard.run_in_background', run_now)
+    @patch('flashcards.screens.scoreboard.load_quiz_history')
+    @patch('tkinter.ttk.Treeview')
+    @patch('tkinter.ttk.Scrollbar')
+    @patch('tkinter.ttk.Style')
+    @patch('tkinter.Frame')
+    @patch('tkinter.Label')
+    @patch('tkinter.Button')
+    def test_style_configured_once(self, mock_button, mock_label, mock_frame,
+                                   mock_style, mock_scrollbar, mock_treeview,
+                                   mock_load_history, monkeypatch):
+        """Test that the shared treeview style is configured on the first open only."""
+        monkeypatch.setattr('flashcards.screens.scoreboard._style_configured', False)
+        mock_load_history.return_value = [
+            {"time": "2024-01-15T10:30:00", "total": 20, "correct": 15},
+        ]
+        mock_frame.return_value = MagicMock()
+
+        ScoreboardScreen(MagicMock(), MagicMock())
+        ScoreboardScreen(MagicMock(), MagicMock())
+
+        mock_style.assert_called_once()
+        assert mock_style.return_value.configure.call_count == 2
+
+    @patch('flashcards.screens.scoreboard.run_in_background', run_now)
+    @patch('flashcards.screens.scoreboard.load_quiz_history')
+    @patch('tkinter.ttk.Treeview')
+    @patch('tkinter.ttk.Scrollbar')
+    @patch('tkinter.ttk.Style')
+    @patch('tkinter.Frame')
+    @patch('tkinter.Label')
+    @patch('tkinter.Button')
+    def test_rows_inserted_in_batches_on_scroll(self, mock_button, mock_label, mock_frame,
+                                                mock_style, mock_scrollbar, mock_treeview,
+                                                mock_load_history):
+        """Test that long histories are inserted a batch at a time as the table scrolls."""
+        mock_load_history.return_value = [
+            {"time": f"2024-01-15T10:{i % 60:02d}:00", "total": 10, "correct": 5}
+            for i in range(250)
+        ]
+        mock_frame.return_value = MagicMock()
+        mock_tree_instance = MagicMock()
+        mock_treeview.return_value = mock_tree_instance
+
+        screen = ScoreboardScreen(MagicMock(), MagicMock())
+        assert mock_tree_instance.insert.call_count == 100
 
+        # Scrolling that isn't near the end loads nothing more
+        screen._on_tree_scrolled("0.0", "0.5")
+        mock_scrollbar.return_value.set.assert_called_with("0.0", "0.5")
+        assert mock_tree_instance.insert.call_count == 100
+
+        screen._on_tree_scrolled("0.5", "0.95")
+        assert mock_tree_instance.insert.call_count == 200
+        screen._on_tree_scrolled("0.8", "1.0")
+        screen._on_tree_scrolled("0.9", "1.0")
+        assert mock_tree_instance.insert.call_count == 250
+
+    @patch('flashcards.screens.scoreboard.run_in_background')
+    @patch('flashcards.screens.scoreboard.load_quiz_history')
+    @patch('tkinter.Frame')
+    @patch('tkinter.Label')
+    @patch('tkinter.Button')
+    def test_history_loaded_in_background(self, mock_button, mock_label, mock_frame,
+                                          mock_load_history, mock_run_in_background):
+        """Test that history is loaded off the Tk thread behind a placeholder."""
+        mock_load_history.return_value = []
+        mock_frame.return_value = MagicMock()
+        mock_label.return_value = MagicMock()
+
+        screen = ScoreboardScreen(MagicMock(), MagicMock())
+
+        mock_run_in_background.assert_called_once_with(
+            screen.frame, mock_load_history, screen._populate, screen._show_load_error
+        )
+        mock_load_history.assert_not_called()
+        mock_label.assert_any_call(
+            screen.frame, text="Loading…", font=("Helvetica", 16), fg="#bdc3c7", bg="#2c3e50"
+        )
+
+        screen._populate([])
+        screen.loading_label.destroy.assert_called_once()
+
+    @patch('flashcards.screens.scoreboard.run_in_background', run_now)
     @patch('flashcards.screens.scoreboard.load_quiz_history')
     @patch('tkinter.Frame')
     @patch('tkinter.Label')
@@ -1420,6 +2037,7 @@ class TestScoreboardScreen:
 
         assert screen.back_to_menu == back_cb
 
+    @patch('flashcards.screens.scoreboard.run_in_background', run_now)
     @patch('flashcards.screens.scoreboard.load_quiz_history')
     @patch('tkinter.Frame')
     @patch('tkinter.Label')
@@ -1476,6 +2094,125 @@ class TestApp:
         mock_root.title.assert_called_with("Flash Card Game - Medical Terminology")
         mock_root.geometry.assert_called_with("600x400")
 
+    @patch('tkinter.Frame')
+    @patch('tkinter.Label')
+    @patch('tkinter.Button')
+    @patch('tkinter.Spinbox')
+    @patch('tkinter.IntVar')
+    @patch('tkinter.BooleanVar')
+    @patch('tkinter.Canvas')
+    @patch('tkinter.Scrollbar')
+    @patch('tkinter.Checkbutton')
+    def test_section_counts_passed_to_menu(self, mock_checkbutton, mock_scrollbar, mock_canvas,
+                                           mock_boolvar, mock_intvar, mock_spinbox, mock_button,
+                                           mock_label, mock_frame, mock_root):
+        """Test that cards are counted per section in order, skipping unsectioned cards."""
+        mock_frame.return_value = MagicMock()
+        mock_canvas.return_value = MagicMock()
+        mock_boolvar.return_value = MagicMock()
+        cards = [
+            Card("a1", "x", section="A"),
+            Card("b1", "x", section="B"),
+            Card("a2", "x", section="A"),
+            Card("none", "x"),
+        ]
+
+        app = App(mock_root, cards)
+
+        assert list(app.main_menu.section_counts.items()) == [("A", 2), ("B", 1)]
+
+    @patch('tkinter.Frame')
+    @patch('tkinter.Label')
+    @patch('tkinter.Button')
+    @patch('tkinter.Spinbox')
+    @patch('tkinter.IntVar')
+    @patch('tkinter.BooleanVar')
+    @patch('tkinter.Canvas')
+    @patch('tkinter.Scrollbar')
+    @patch('tkinter.Checkbutton')
+    def test_set_cards_replaces_menu(self, mock_checkbutton, mock_scrollbar, mock_canvas,
+                                     mock_boolvar, mock_intvar, mock_spinbox, mock_button,
+                                     mock_label, mock_frame, mock_root):
+        """Test that loading a deck after startup rebuilds the section index and menu."""
+        mock_frame.return_value = MagicMock()
+        mock_canvas.return_value = MagicMock()
+        mock_boolvar.return_value = MagicMock()
+        app = App(mock_root, [], loading=True)
+        empty_menu = app.main_menu
+        assert empty_menu.section_counts == {}
+        assert empty_menu.loading
+
+        cards = [Card("a1", "x", section="A"), Card("b1", "x", section="B")]
+        app.set_cards(cards, ["A", "B"])
+
+        assert app.main_menu is not empty_menu
+        empty_menu.frame.destroy.assert_called_once()
+        assert app.main_menu.section_counts == {"A": 1, "B": 1}
+        assert not app.main_menu.loading
+        assert app._filter_cards(frozenset({"B"})) == [cards[1]]
+        app.main_menu.frame.pack.assert_called()
+
+    @patch('tkinter.Frame')
+    @patch('tkinter.Label')
+    @patch('tkinter.Button')
+    @patch('tkinter.Spinbox')
+    @patch('tkinter.IntVar')
+    def test_set_cards_with_empty_deck_ends_loading(self, mock_intvar, mock_spinbox, mock_button,
+                                                    mock_label, mock_frame, mock_root):
+        """Test that loading an empty deck replaces the Loading… menu with a no-cards notice."""
+        mock_frame.side_effect = lambda *args, **kwargs: MagicMock()
+        app = App(mock_root, [], loading=True)
+        loading_menu = app.main_menu
+        mock_label.reset_mock()
+        mock_button.reset_mock()
+
+        app.set_cards([], [])
+
+        loading_menu.frame.destroy.assert_called_once()
+        texts = [c.kwargs.get("text") for c in mock_label.call_args_list]
+        assert "Loading…" not in texts
+        assert "No cards found" in texts
+        states = {c.kwargs["text"]: c.kwargs.get("state") for c in mock_button.call_args_list}
+        assert states["Quiz Mode"] == tk.NORMAL
+
+    @patch('tkinter.Frame')
+    @patch('tkinter.Label')
+    @patch('tkinter.Button')
+    @patch('tkinter.Spinbox')
+    @patch('tkinter.IntVar')
+    @patch('tkinter.BooleanVar')
+    @patch('tkinter.Canvas')
+    @patch('tkinter.Scrollbar')
+    @patch('tkinter.Checkbutton')
+    @patch('flashcards.controller.spread_shuffle_with_replacement')
+    def test_filtered_deck_reused_for_same_selection(self, mock_spread_shuffle, mock_checkbutton,
+                                                     mock_scrollbar, mock_canvas, mock_boolvar,
+                                                     mock_intvar, mock_spinbox, mock_button,
+                                                     mock_label, mock_frame, mock_root):
+        """Test that the filtered deck is built once per section selection."""
+        mock_frame.return_value = MagicMock()
+        mock_canvas.return_value = MagicMock()
+        mock_boolvar.return_value = MagicMock()
+        cards = [
+            Card("a1", "x", section="A"),
+            Card("b1", "x", section="B"),
+            Card("a2", "x", section="A"),
+        ]
+
+        app = App(mock_root, cards)
+        app.main_menu.get_selected_sections = MagicMock(return_value={"A"})
+        app._prepare_mode_cards()
+        first = mock_spread_shuffle.call_args[0][0]
+        app._prepare_mode_cards()
+        second = mock_spread_shuffle.call_args[0][0]
+
+        assert [c.term for c in first] == ["a1", "a2"]
+        assert second is first
+
+        app.main_menu.get_selected_sections = MagicMock(return_value={"B"})
+        app._prepare_mode_cards()
+        assert [c.term for c in mock_spread_shuffle.call_args[0][0]] == ["b1"]
+
     @patch('flashcards.app.FlashCardApp')
     @patch('tkinter.Frame')
     @patch('tkinter.Label')
@@ -1507,6 +2244,95 @@ class TestApp:
 
         # spread_shuffle_with_replacement samples with replacement and spreads sections
         mock_spread_shuffle.assert_called_with(sample_cards, 50)
+        # All sections selected: the deck is sampled directly, without a filtered copy
+        assert mock_spread_shuffle.call_args[0][0] is app.cards
+
+    @patch('tkinter.Frame')
+    @patch('tkinter.Label')
+    @patch('tkinter.Button')
+    @patch('tkinter.Spinbox')
+    @patch('tkinter.IntVar')
+    @patch('tkinter.BooleanVar')
+    @patch('tkinter.Canvas')
+    @patch('tkinter.Scrollbar')
+    @patch('tkinter.Checkbutton')
+    @patch('flashcards.controller.spread_shuffle_with_replacement')
+    def test_flashcard_screen_reused_across_visits(self, mock_spread_shuffle, mock_checkbutton,
+                                                   mock_scrollbar, mock_canvas, mock_boolvar,
+                                                   mock_intvar, mock_spinbox, mock_button,
+                                                   mock_label, mock_frame, mock_root, sample_cards):
+        """Test that revisiting a flashcard mode reuses its screen with the new deck."""
+        mock_intvar_instance = MagicMock()
+        mock_intvar_instance.get.return_value = 50
+        mock_intvar.return_value = mock_intvar_instance
+        mock_frame.return_value = MagicMock()
+        mock_canvas.return_value = MagicMock()
+        mock_boolvar.return_value = MagicMock()
+        mock_spread_shuffle.return_value = sample_cards
+
+        app = App(mock_root, sample_cards)
+        app.main_menu.get_selected_sections = MagicMock(return_value={"General"})
+        app._start_simple_mode()
+        first_screen = app.flashcard_app
+        first_screen.current_index = 2
+        app._back_to_menu()
+
+        mock_spread_shuffle.return_value = sample_cards[:1]
+        app._start_simple_mode()
+
+        assert app.flashcard_app is first_screen
+        assert app.flashcard_app.cards == sample_cards[:1]
+        assert app.flashcard_app.current_index == 0
+
+        app._back_to_menu()
+        app._start_inverted_mode()
+        assert app.flashcard_app is not first_screen
+        assert app.flashcard_app.mode == "inverted"
+
+    @patch('tkinter.Frame')
+    @patch('tkinter.Label')
+    @patch('tkinter.Button')
+    @patch('tkinter.Spinbox')
+    @patch('tkinter.IntVar')
+    @patch('tkinter.BooleanVar')
+    @patch('tkinter.Canvas')
+    @patch('tkinter.Scrollbar')
+    @patch('tkinter.Checkbutton')
+    @patch('flashcards.controller.spread_shuffle_with_replacement')
+    def test_navigation_keys_forward_to_active_screen(self, mock_spread_shuffle, mock_checkbutton,
+                                                      mock_scrollbar, mock_canvas, mock_boolvar,
+                                                      mock_intvar, mock_spinbox, mock_button,
+                                                      mock_label, mock_frame, mock_root, sample_cards):
+        """Test that root key bindings are made once and reach the shown flashcard screen."""
+        mock_intvar_instance = MagicMock()
+        mock_intvar_instance.get.return_value = 50
+        mock_intvar.return_value = mock_intvar_instance
+        mock_frame.return_value = MagicMock()
+        mock_canvas.return_value = MagicMock()
+        mock_boolvar.return_value = MagicMock()
+        mock_spread_shuffle.return_value = sample_cards
+
+        app = App(mock_root, sample_cards)
+        app.main_menu.get_selected_sections = MagicMock(return_value={"General"})
+        app._start_simple_mode()
+        app._back_to_menu()
+        app._start_simple_mode()
+
+        bindings = {c[0][0]: c[0][1] for c in mock_root.bind.call_args_list}
+        bound_keys = [c[0][0] for c in mock_root.bind.call_args_list]
+        assert bound_keys.count("<Right>") == 1
+        assert bound_keys.count("<Return>") == 1
+
+        bindings["<Right>"](None)
+        assert app.flashcard_app.current_index == 1
+        bindings["<Return>"](None)
+        assert app.flashcard_app.is_flipped
+
+        # Keys are ignored while the menu is shown
+        screen = app.flashcard_app
+        app._back_to_menu()
+        bindings["<Right>"](None)
+        assert screen.current_index == 1
 
     @patch('flashcards.app.FlashCardApp')
     @patch('tkinter.Frame')
@@ -1612,53 +2438,73 @@ class TestApp:
 class TestIntegration:
     """Integration tests that test component interactions."""
 
-    def test_parse_and_use_real_file(self):
-        """Test parsing the actual medical-terms.md file if it exists."""
-        script_dir = Path(__file__).parent
-        md_file = script_dir / "medical-terms.md"
-
-        if md_file.exists():
-            cards, sections = parse_markdown_tables(str(md_file))
-            assert len(cards) > 0
-            assert len(sections) > 0
-
-            # Verify card structure
-            for card in cards:
-                assert "term" in card
-                assert "interpretation" in card
-                assert "extra" in card
-                assert "section" in card
-                assert isinstance(card["term"], str)
-                assert isinstance(card["interpretation"], str)
-                assert isinstance(card["extra"], str)
-                assert isinstance(card["section"], str)
-
-    def test_card_data_integrity(self):
-        """Test that all cards have required fields."""
-        script_dir = Path(__file__).parent
-        md_file = script_dir / "medical-terms.md"
+    @patch('flashcards.main.run_in_background', run_now)
+    @patch('flashcards.main.start_in_background')
+    def test_loaded_deck_handed_to_app_and_warmed(self, mock_start, tmp_path):
+        """Test that a parsed deck reaches the app and its RTL faces are warmed in the background."""
+        from flashcards.main import _load_deck
 
-        if md_file.exists():
-            cards, sections = parse_markdown_tables(str(md_file))
+        md_file = tmp_path / "medical-terms.md"
+        md_file.write_text("| Term | Meaning |\n|----|----|\n| a | b |\n", encoding="utf-8")
+        app = MagicMock()
 
-            for i, card in enumerate(cards):
-                assert card["term"], f"Card {i} has empty term"
-                assert card["interpretation"], f"Card {i} has empty interpretation"
-                assert card["section"], f"Card {i} has empty section"
+        _load_deck(MagicMock(), app, md_file)
 
-    def test_rtl_with_real_hebrew_text(self):
-        """Test RTL function with real Hebrew medical terms."""
-        hebrew_texts = [
-            "יתר לחץ דם",
-            "דופק איטי",
-            "תורת מבנה הגוף ואיבריו",
-            "החייאת לב ריאה",
-        ]
+        cards, sections = app.set_cards.call_args.args
+        assert [card.term for card in cards] == ["a"]
+        mock_start.assert_called_once_with(warm_rtl_cache, cards)
+
+    @patch('flashcards.main.run_in_background', run_now)
+    @patch('tkinter.messagebox.showerror')
+    def test_deck_load_error_reported(self, mock_showerror, tmp_path):
+        """Test that a deck that fails to parse is reported and closes the window."""
+        from flashcards.main import _load_deck
+
+        md_file = tmp_path / "medical-terms.md"
+        md_file.write_bytes(b"| term | \xff |\n|----|----|\n")
+        root = MagicMock()
+        app = MagicMock()
+
+        _load_deck(root, app, md_file)
 
-        for text in hebrew_texts:
-            result = fix_rtl(text)
-            assert isinstance(result, str)
-            assert len(result) > 0
+        mock_showerror.assert_called_once()
+        root.destroy.assert_called_once()
+        app.set_cards.assert_not_called()
+
+    def test_parse_and_use_real_file(self, real_deck):
+        """Test parsing the actual medical-terms.md file if it exists."""
+        cards, sections = real_deck
+        assert len(cards) > 0
+        assert len(sections) > 0
+
+        # Verify card structure
+        for card in cards:
+            assert isinstance(card, Card)
+            assert isinstance(card.term, str)
+            assert isinstance(card.interpretation, str)
+            assert isinstance(card.extra, str)
+            assert isinstance(card.section, str)
+
+    def test_card_data_integrity(self, real_deck):
+        """Test that all cards have required fields."""
+        cards, sections = real_deck
+
+        for i, card in enumerate(cards):
+            assert card.term, f"Card {i} has empty term"
+            assert card.interpretation, f"Card {i} has empty interpretation"
+            assert card.section, f"Card {i} has empty section"
+
+    @pytest.mark.parametrize("text", [
+        "יתר לחץ דם",
+        "דופק איטי",
+        "תורת מבנה הגוף ואיבריו",
+        "החייאת לב ריאה",
+    ])
+    def test_rtl_with_real_hebrew_text(self, text):
+        """Test RTL function with real Hebrew medical terms."""
+        result = fix_rtl(text)
+        assert isinstance(result, str)
+        assert len(result) > 0
 
 
 # =============================================================================
@@ -1668,31 +2514,25 @@ class TestIntegration:
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
 
-    def test_single_card_deck(self, tmp_path):
+    def test_single_card_deck(self):
         """Test with only one card."""
         md_content = """| Term | Interpretation |
 | ---- | -------------- |
 | only_card | single_interp |
 """
-        md_file = tmp_path / "single.md"
-        md_file.write_text(md_content, encoding="utf-8")
-
-        cards, sections = parse_markdown_tables(str(md_file))
+        cards, sections = parse_markdown_text(md_content)
         assert len(cards) == 1
 
-    def test_very_long_term(self, tmp_path):
+    def test_very_long_term(self):
         """Test with very long term text."""
         long_term = "a" * 200
         md_content = f"""| Term | Interpretation |
 | ---- | -------------- |
 | {long_term} | interp |
 """
-        md_file = tmp_path / "long.md"
-        md_file.write_text(md_content, encoding="utf-8")
-
-        cards, sections = parse_markdown_tables(str(md_file))
+        cards, sections = parse_markdown_text(md_content)
         assert len(cards) == 1
-        assert len(cards[0]["term"]) == 200
+        assert len(cards[0].term) == 200
 
     def test_unicode_in_terms(self, tmp_path):
         """Test with various Unicode characters."""
@@ -1707,22 +2547,19 @@ class TestEdgeCases:
 
         cards, sections = parse_markdown_tables(str(md_file))
         assert len(cards) == 3
-        assert cards[0]["term"] == "café"
+        assert cards[0].term == "café"
 
-    def test_table_header_variations(self, tmp_path):
+    def test_table_header_variations(self):
         """Test tables with different header names."""
         md_content = """| Name | Definition | Notes |
 | ---- | ---------- | ----- |
 | term1 | def1 | note1 |
 """
-        md_file = tmp_path / "headers.md"
-        md_file.write_text(md_content, encoding="utf-8")
-
-        cards, sections = parse_markdown_tables(str(md_file))
+        cards, sections = parse_markdown_text(md_content)
         assert len(cards) == 1
         # Parser doesn't care about header names, just position
 
-    def test_mixed_content_file(self, tmp_path):
+    def test_mixed_content_file(self):
         """Test file with mixed markdown content."""
         md_content = """# Medical Terms
 
@@ -1744,10 +2581,7 @@ More text between tables.
 
 Conclusion text.
 """
-        md_file = tmp_path / "mixed.md"
-        md_file.write_text(md_content, encoding="utf-8")
-
-        cards, sections = parse_markdown_tables(str(md_file))
+        cards, sections = parse_markdown_text(md_content)
         assert len(cards) == 2
 
 
@@ -1762,8 +2596,7 @@ class TestPerformance:
         """Test parsing a large file with many cards."""
         # Generate 1000 rows
         rows = ["| Term | Interpretation |", "| ---- | -------------- |"]
-        for i in range(1000):
-            rows.append(f"| term{i} | interp{i} |")
+        rows += [f"| term{i} | interp{i} |" for i in range(1000)]
 
         md_content = "\n".join(rows)
         md_file = tmp_path / "large.md"
@@ -1772,12 +2605,31 @@ class TestPerformance:
         cards, sections = parse_markdown_tables(str(md_file))
         assert len(cards) == 1000
 
-    def test_fix_rtl_performance_with_long_text(self):
+    @pytest.mark.parametrize("repeats", [100, 500, 2000])
+    def test_fix_rtl_performance_with_long_text(self, repeats):
         """Test fix_rtl with very long text."""
-        long_text = "שלום " * 500  # ~2500 characters
+        long_text = "שלום " * repeats  # 5 characters per repeat
         result = fix_rtl(long_text)
         assert isinstance(result, str)
 
+    def test_package_import_does_not_load_tkinter(self):
+        """Test that importing the package and its parser leaves tkinter unloaded,
+        and that the controller only loads the main menu screen."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, flashcards\n"
+            "from flashcards import parse_markdown_tables\n"
+            "assert 'tkinter' not in sys.modules\n"
+            "import flashcards.controller\n"
+            "assert 'flashcards.screens.main_menu' in sys.modules\n"
+            "assert 'flashcards.screens.quiz' not in sys.modules\n"
+            "assert 'flashcards.screens.scoreboard' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True,
+                       cwd=Path(__file__).parent.parent)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
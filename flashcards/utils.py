@@ -1,23 +1,71 @@
 """Utility functions for the flash card application."""
 
+import functools
+import mmap
+import os
 import random
+import re
+import sys
+from bisect import bisect_left
 from collections import defaultdict
-from pathlib import Path
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain, zip_longest
+from types import MappingProxyType
 
 from bidi import get_display
 import textwrap
 
+from .models import Card
 
-def spread_shuffle_with_replacement(cards: list[dict], k: int) -> list[dict]:
-    """Sample k cards with replacement, then spread sections apart.
+# Matches one markdown block per hit: a section title underlined with ====,
+# a table (header, ---- separator and body rows), or a table header that is
+# not followed by a separator.
+_BLOCK_RE = re.compile(
+    r"^(?P<title>[^\n]*)\n[^\S\n]*====[^\n]*$"
+    r"|^[^\S\n]*\|[^\n]*\|[^\n]*\n[^\n]*----[^\n]*"
+    r"(?:\n(?P<rows>(?:[^\S\n]*\|[^\n]*(?:\n|$))*))?"
+    r"|^[^\S\n]*\|[^\n]*\|",
+    re.MULTILINE,
+)
+# A single table body row, without surrounding whitespace
+_ROW_RE = re.compile(r"^[^\S\n]*(\|(?:[^\n]*\S)?)", re.MULTILINE)
+# Font sizing for card text: texts up to _FONT_SIZE_LIMITS[i] characters long
+# (newlines excluded) use _FONT_SIZES[i], longer ones the last entry. The
+# settings are shared between calls, so they are read-only.
+_FONT_SIZE_LIMITS = (30, 60, 100, 150, 200, 300, 400, 500)
+_FONT_SIZES = tuple(
+    MappingProxyType({'font_size': font_size, 'wrap_chars': wrap_chars, 'wraplength': wraplength})
+    for font_size, wrap_chars, wraplength in (
+        (22, 25, 500),
+        (18, 30, 450),
+        (16, 35, 420),
+        (14, 40, 400),
+        (12, 45, 380),
+        (10, 50, 400),
+        (9, 60, 400),
+        (8, 65, 400),
+        (7, 70, 400),
+    )
+)
+# How often the Tk thread checks whether a background call has finished
+_BACKGROUND_POLL_MS = 10
+
+
+def spread_shuffle_with_replacement(cards: list[Card], k: int) -> list[Card]:
+    """Sample k cards, then spread sections apart.
 
     This creates a "humanly random" shuffle by:
-    1. Sampling k cards with replacement (allowing duplicates)
-    2. Grouping by section and shuffling within each section
+    1. Sampling k distinct cards, or with replacement (allowing duplicates)
+       when k exceeds the number of cards
+    2. Grouping by section
     3. Round-robin merging to spread cards from the same section apart
 
+    Either sample is already in random order within each section, so unlike
+    spread_shuffle the groups are not shuffled again.
+
     Args:
-        cards: List of card dictionaries with 'section' key
+        cards: List of cards
         k: Number of cards to sample
 
     Returns:
@@ -26,134 +74,185 @@ def spread_shuffle_with_replacement(cards: list[dict], k: int) -> list[dict]:
     if not cards:
         return []
 
-    # Sample with replacement
-    sampled = random.choices(cards, k=k)
+    if k <= len(cards):
+        sampled = random.sample(cards, k)
+    else:
+        sampled = random.choices(cards, k=k)
 
-    return spread_shuffle(sampled)
+    return _spread_sections(sampled, shuffle_groups=False)
 
 
-def spread_shuffle(cards: list[dict]) -> list[dict]:
+def spread_shuffle(cards: list[Card]) -> list[Card]:
     """Shuffle cards while spreading sections apart.
 
     Groups cards by section, shuffles within each group, then round-robin
     merges to minimize consecutive cards from the same section.
 
     Args:
-        cards: List of card dictionaries with 'section' key
+        cards: List of cards
 
     Returns:
         A new list with cards spread by section
     """
+    return _spread_sections(cards, shuffle_groups=True)
+
+
+def _spread_sections(cards: list[Card], shuffle_groups: bool) -> list[Card]:
+    """Round-robin merge cards by section, optionally shuffling each section first."""
     if not cards:
         return []
 
     # Group by section
     by_section = defaultdict(list)
     for card in cards:
-        by_section[card.get('section', '')].append(card)
+        by_section[card.section].append(card)
 
     # Shuffle within each section group
-    for section_cards in by_section.values():
-        random.shuffle(section_cards)
+    if shuffle_groups:
+        for section_cards in by_section.values():
+            random.shuffle(section_cards)
 
-    # Round-robin merge from each section
-    result = []
+    # Round-robin merge from each section, skipping sections once they run out
     sections = list(by_section.values())
     random.shuffle(sections)  # randomize section order
 
-    while any(sections):
-        for section_cards in sections:
-            if section_cards:
-                result.append(section_cards.pop())
+    rounds = chain.from_iterable(zip_longest(*sections))
+    return [card for card in rounds if card is not None]
+
 
-    return result
+@functools.lru_cache(maxsize=None)
+def _text_wrapper(width: int) -> textwrap.TextWrapper:
+    """Return a shared TextWrapper for the given width (only a handful are used)."""
+    return textwrap.TextWrapper(width=width)
 
 
+@functools.lru_cache(maxsize=4096)
 def fix_rtl(text: str, wrap_width: int = 25) -> str:
-    """Fix right-to-left text display by wrapping and applying bidi algorithm."""
+    """Fix right-to-left text display by wrapping and applying bidi algorithm.
+
+    Results are memoized since the same card text is re-rendered on every
+    flip and navigation.
+    """
+    # The bidi algorithm is the identity on ASCII, so only the wrapping applies
+    display = (lambda line: line) if text.isascii() else get_display
     if wrap_width is None:
-        return get_display(text)
+        return display(text)
     # We do the wrapping manually outside of tkinter to handle peculiarities since the text is RTL
+    wrapper = _text_wrapper(wrap_width)
     text_parts = text.split("\n\n")
     wrapped_parts = []
     for part in text_parts:
-        lines = textwrap.wrap(part, width=wrap_width)
+        lines = wrapper.wrap(part)
         wrapped_parts.append(lines)
-    return "\n\n".join(["\n".join([get_display(line) for line in lines]) for lines in wrapped_parts])
+    return "\n\n".join(["\n".join([display(line) for line in lines]) for lines in wrapped_parts])
+
+
+def warm_rtl_cache(cards: list[Card]) -> None:
+    """Render the RTL faces of every card so screens later hit the fix_rtl cache.
+
+    Meant to run on a background thread while the main menu is idle.
+    """
+    for card in cards:
+        for text in (card.interpretation, card.full_interpretation):
+            fix_rtl(text, calculate_font_size(text)['wrap_chars'])
+
+
+def start_in_background(func: callable, *args) -> Future:
+    """Call func(*args) on a worker thread and return its Future without waiting."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(func, *args)
+    executor.shutdown(wait=False)
+    return future
+
+
+def run_in_background(widget, func: callable, on_done: callable, on_error: callable, *args) -> None:
+    """Call func(*args) on a worker thread and pass its result to on_done.
+
+    Tk may only be used from the main thread, so the worker does not call
+    back into Tk; widget.after() polls for the result and on_done runs on
+    the Tk thread. If func raises, on_error gets the exception instead.
+    """
+    future = start_in_background(func, *args)
+
+    def poll():
+        if not future.done():
+            widget.after(_BACKGROUND_POLL_MS, poll)
+        elif future.exception() is not None:
+            on_error(future.exception())
+        else:
+            on_done(future.result())
+
+    poll()
 
 
-def calculate_font_size(text: str) -> dict:
+def calculate_font_size(text: str) -> Mapping[str, int]:
     """Calculate font size and wrap settings based on text length."""
-    text_len = len(text.replace('\n', ''))
-
-    if text_len <= 30:
-        return {'font_size': 22, 'wrap_chars': 25, 'wraplength': 500}
-    elif text_len <= 60:
-        return {'font_size': 18, 'wrap_chars': 30, 'wraplength': 450}
-    elif text_len <= 100:
-        return {'font_size': 16, 'wrap_chars': 35, 'wraplength': 420}
-    elif text_len <= 150:
-        return {'font_size': 14, 'wrap_chars': 40, 'wraplength': 400}
-    elif text_len <= 200:
-        return {'font_size': 12, 'wrap_chars': 45, 'wraplength': 380}
-    elif text_len <= 300:
-        return {'font_size': 10, 'wrap_chars': 50, 'wraplength': 400}
-    elif text_len <= 400:
-        return {'font_size': 9, 'wrap_chars': 60, 'wraplength': 400}
-    elif text_len <= 500:
-        return {'font_size': 8, 'wrap_chars': 65, 'wraplength': 400}
-    else:
-        return {'font_size': 7, 'wrap_chars': 70, 'wraplength': 400}
+    text_len = len(text) - text.count('\n')
+    return _FONT_SIZES[bisect_left(_FONT_SIZE_LIMITS, text_len)]
+
 
+def _split_cells(row: str) -> list[str]:
+    """Split a stripped table row into cells, dropping the outer pipes.
 
-def parse_markdown_tables(filepath: str) -> tuple[list[dict], list[str]]:
+    The trailing pipe is optional, and empty interior cells are kept so that
+    later columns don't shift left.
+    """
+    parts = row.split("|")[1:]
+    if row.endswith("|"):
+        parts = parts[:-1]
+    return [c.strip() for c in parts]
+
+
+def _read_text(filepath: str) -> str:
+    """Read a UTF-8 file, decoding straight from a memory map.
+
+    This avoids holding an intermediate bytes copy of the file next to the
+    decoded text.
+    """
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""  # empty files cannot be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(mm, "utf-8")
+
+
+def parse_markdown_tables(filepath: str) -> tuple[list[Card], list[str]]:
     """Parse markdown tables from file and return list of flash cards with sections."""
+    return parse_markdown_text(_read_text(filepath))
+
+
+def parse_markdown_text(content: str) -> tuple[list[Card], list[str]]:
+    """Parse markdown tables from text and return list of flash cards with sections."""
     cards = []
     sections = []
     current_section = "General"
-    content = Path(filepath).read_text(encoding="utf-8")
-    lines = content.split("\n")
-
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
 
-        # Check for section title (line followed by ====)
-        if i + 1 < len(lines) and lines[i + 1].strip().startswith("===="):
-            current_section = line
+    for match in _BLOCK_RE.finditer(content):
+        title = match.group("title")
+        if title is not None:
+            current_section = title.strip()
             if current_section not in sections:
                 sections.append(current_section)
-            i += 2
             continue
 
-        # Check if this is a table header row (starts with |)
-        if line.startswith("|") and "|" in line[1:]:
-            if current_section not in sections:
-                sections.append(current_section)
-            # Skip the separator line (contains ----)
-            if i + 1 < len(lines) and "----" in lines[i + 1]:
-                i += 2  # Move past header and separator
-                # Parse table rows
-                while i < len(lines):
-                    row = lines[i].strip()
-                    if not row.startswith("|"):
-                        break
-                    # Split by | and clean up
-                    cells = [c.strip() for c in row.split("|")]
-                    # Remove empty strings from split
-                    cells = [c for c in cells if c or cells.index(c) not in [0, len(cells) - 1]]
-                    cells = [c for c in cells if c]
-
-                    if len(cells) >= 2:
-                        card = {
-                            "term": cells[0],
-                            "interpretation": cells[1],
-                            "extra": cells[2] if len(cells) > 2 else "",
-                            "section": current_section,
-                        }
-                        cards.append(card)
-                    i += 1
-                continue
-        i += 1
+        # Table header (with or without a body)
+        if current_section not in sections:
+            sections.append(current_section)
+        rows_start, rows_end = match.span("rows")
+        if rows_start == rows_end:
+            continue
+        for row in _ROW_RE.finditer(content, rows_start, rows_end):
+            cells = _split_cells(row.group(1))
+
+            if len(cells) >= 2 and cells[0] and cells[1]:
+                # Terms and notes (abbreviations, "pl.", ...) repeat across
+                # rows, so they are interned to share one object per value
+                card = Card(
+                    term=sys.intern(cells[0]),
+                    interpretation=cells[1],
+                    extra=sys.intern(cells[2]) if len(cells) > 2 else "",
+                    section=current_section,
+                )
+                cards.append(card)
 
     return cards, sections